@@ -4,172 +4,485 @@ UNIFIED DATA AGGREGATION & REPORTING
 Query and analyze combined results from all portals
 """
 
+import functools
+import itertools
 import sqlite3
 import pandas as pd
+from openpyxl import Workbook
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator, Optional, Union
+
+# Try to import the ADBC SQLite driver (Arrow-native reads)
+try:
+    import adbc_driver_sqlite.dbapi as adbc_sqlite
+    ADBC_AVAILABLE = True
+except ImportError:
+    ADBC_AVAILABLE = False
+
+# Try to import xlsxwriter (constant-memory Excel writer); openpyxl write-only otherwise
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
 
 DATABASE_PATH = "database/multi_portal_tenders.db"
 
+# Rows fetched per chunk when streaming large sheets to Excel
+EXPORT_CHUNK_SIZE = 10_000
+
+# Tuning applied once to every analyzer connection. The connection is
+# read-only, so journal mode (WAL) is owned by the scraper writers.
+CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+def read_only_uri(db_path: str) -> str:
+    """SQLite URI that opens the database read-only"""
+    return Path(db_path).resolve().as_uri() + "?mode=ro"
+
+def open_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Open a tuned read-only connection meant to be reused across queries.
+    With the writers in WAL mode, its reads never block scraper inserts.
+    """
+    conn = sqlite3.connect(read_only_uri(db_path), uri=True, check_same_thread=False)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def s_no_sort_expression(conn: sqlite3.Connection) -> str:
+    """
+    Numeric S.No. sort key for the {s_no_sort} placeholder in the queries.
+    s_no_int only exists once a scraper has opened the database and migrated
+    its schema; older files sort on the same expression computed inline.
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(tenders)")}
+    return "s_no_int" if "s_no_int" in columns else "CAST(s_no AS INTEGER)"
+
+def _read_query(db_path: str, query: str, conn: Optional[sqlite3.Connection] = None,
+                params: tuple = ()) -> pd.DataFrame:
+    """Run a query on the given connection, or on a short-lived one if none is passed"""
+    if conn is not None:
+        return pd.read_sql_query(query.format(s_no_sort=s_no_sort_expression(conn)), conn, params=params)
+    
+    conn = open_connection(db_path)
+    try:
+        return pd.read_sql_query(query.format(s_no_sort=s_no_sort_expression(conn)), conn, params=params)
+    finally:
+        conn.close()
+
+def _format_rows(headers: list, rows: list) -> str:
+    """Right-aligned plain-text table, for small console result sets"""
+    cells = [[str(h) for h in headers]]
+    cells += [['' if v is None else str(v) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    return "\n".join("  ".join(c.rjust(w) for c, w in zip(row, widths)) for row in cells)
+
+# ======================= QUERY STATEMENTS =======================
+# Queries alias columns in snake_case; each *_COLUMNS map gives the display
+# names used only for console output and Excel export.
+
+COMBINED_STATISTICS_SQL = """
+WITH per_portal AS (
+    SELECT 
+        portal_id,
+        portal_source,
+        COUNT(*) AS total_extracted,
+        COUNT(*) FILTER (WHERE ai_filtered = 1) AS ai_kept,
+        COUNT(*) FILTER (WHERE ai_filtered = -1) AS ai_filtered,
+        COUNT(*) FILTER (WHERE phase2_status = 'success') AS phase2_success,
+        COUNT(*) FILTER (WHERE phase2_status = 'failed') AS phase2_failed,
+        COUNT(*) FILTER (WHERE phase2_status = 'pending') AS phase2_pending
+    FROM tenders
+    GROUP BY portal_id, portal_source
+)
+SELECT 
+    portal_id, portal_source, total_extracted, ai_kept, ai_filtered,
+    phase2_success, phase2_failed, phase2_pending
+FROM (
+    SELECT 0 AS is_total, * FROM per_portal
+    UNION ALL
+    SELECT 
+        1, 'TOTAL', 'All Portals',
+        COALESCE(SUM(total_extracted), 0),
+        COALESCE(SUM(ai_kept), 0),
+        COALESCE(SUM(ai_filtered), 0),
+        COALESCE(SUM(phase2_success), 0),
+        COALESCE(SUM(phase2_failed), 0),
+        COALESCE(SUM(phase2_pending), 0)
+    FROM per_portal
+)
+ORDER BY is_total, portal_id
+"""
+
+STATISTICS_COLUMNS = {
+    'portal_id': 'Portal ID',
+    'portal_source': 'Portal Name',
+    'total_extracted': 'Total Extracted',
+    'ai_kept': 'AI Kept',
+    'ai_filtered': 'AI Filtered',
+    'phase2_success': 'Phase 2 Success',
+    'phase2_failed': 'Phase 2 Failed',
+    'phase2_pending': 'Phase 2 Pending'
+}
+
+KEPT_TENDERS_SQL = """
+SELECT 
+    portal_id,
+    portal_source,
+    s_no,
+    title,
+    work_description,
+    e_published_date,
+    closing_date,
+    opening_date,
+    org_chain,
+    details_url,
+    phase2_status
+FROM tenders
+WHERE ai_filtered = 1
+ORDER BY portal_id, {s_no_sort}
+"""
+
+KEPT_TENDERS_COLUMNS = {
+    'portal_id': 'Portal ID',
+    'portal_source': 'Portal Source',
+    's_no': 'S.No.',
+    'title': 'Title',
+    'work_description': 'Work Description',
+    'e_published_date': 'e-Published Date',
+    'closing_date': 'Closing Date',
+    'opening_date': 'Opening Date',
+    'org_chain': 'Organisation',
+    'details_url': 'Details URL',
+    'phase2_status': 'Phase 2 Status'
+}
+
+EXECUTION_HISTORY_SQL = """
+SELECT 
+    portal_id,
+    datetime(execution_start) AS start_time,
+    datetime(execution_end) AS end_time,
+    ROUND((julianday(execution_end) - julianday(execution_start)) * 24 * 60, 1) AS duration_min,
+    status,
+    total_extracted,
+    total_kept,
+    phase2_success,
+    phase2_failed,
+    error_message
+FROM portal_execution_log
+ORDER BY execution_start DESC
+"""
+
+EXECUTION_HISTORY_COLUMNS = {
+    'portal_id': 'Portal ID',
+    'start_time': 'Start Time',
+    'end_time': 'End Time',
+    'duration_min': 'Duration (min)',
+    'status': 'Status',
+    'total_extracted': 'Extracted',
+    'total_kept': 'Kept',
+    'phase2_success': 'P2 Success',
+    'phase2_failed': 'P2 Failed',
+    'error_message': 'Error'
+}
+
+FAILED_URLS_SUMMARY_SQL = """
+SELECT 
+    f.portal_id,
+    COUNT(*) AS failed_count,
+    GROUP_CONCAT(DISTINCT f.failure_reason) AS failure_reasons
+FROM failed_urls f
+WHERE f.status = 'failed'
+GROUP BY f.portal_id
+ORDER BY COUNT(*) DESC
+"""
+
+FAILED_URLS_COLUMNS = {
+    'portal_id': 'Portal ID',
+    'failed_count': 'Failed Count',
+    'failure_reasons': 'Failure Reasons'
+}
+
+CLOSING_TENDERS_SQL = """
+SELECT 
+    portal_id,
+    portal_source,
+    title,
+    closing_date,
+    org_chain,
+    details_url
+FROM tenders
+WHERE ai_filtered = 1
+AND phase2_status = 'success'
+ORDER BY closing_date
+"""
+
+CLOSING_TENDERS_COLUMNS = {
+    'portal_id': 'Portal ID',
+    'portal_source': 'Portal',
+    'title': 'Title',
+    'closing_date': 'Closing Date',
+    'org_chain': 'Organisation',
+    'details_url': 'URL'
+}
+
+PORTAL_TENDERS_SQL = """
+SELECT 
+    s_no,
+    title,
+    work_description,
+    closing_date,
+    org_chain
+FROM tenders
+WHERE portal_id = ?
+AND ai_filtered = 1
+ORDER BY {s_no_sort}
+"""
+
+PORTAL_TENDERS_COLUMNS = {
+    's_no': 'S.No.',
+    'title': 'Title',
+    'work_description': 'Work Description',
+    'closing_date': 'Closing Date',
+    'org_chain': 'Organisation'
+}
+
+KEYWORD_SEARCH_SQL = """
+SELECT 
+    portal_id,
+    title,
+    work_description,
+    closing_date,
+    details_url
+FROM tenders
+WHERE ai_filtered = 1
+AND (
+    title LIKE ?
+    OR work_description LIKE ?
+)
+ORDER BY portal_id, closing_date
+"""
+
+KEYWORD_SEARCH_COLUMNS = {
+    'portal_id': 'Portal',
+    'title': 'Title',
+    'work_description': 'Work Description',
+    'closing_date': 'Closing Date',
+    'details_url': 'URL'
+}
+
+# Computed from the combined statistics in compare_portals_performance
+PORTAL_PERFORMANCE_COLUMNS = {
+    'portal_id': 'Portal',
+    'total_tenders': 'Total Tenders',
+    'kept': 'Kept',
+    'keep_rate_pct': 'Keep Rate %',
+    'phase2_success': 'Phase 2 Success',
+    'success_rate_pct': 'Success Rate %'
+}
+
 # ======================= AGGREGATION QUERIES =======================
 
+def _cached_query(method):
+    """
+    Memoize a DataFrame-returning analyzer query.
+    Entries are reused until PRAGMA data_version reports a commit from another
+    connection. Streamed (chunksize) calls are served from a fresh cached frame
+    when one exists, otherwise they stream from SQLite without caching.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        chunksize = kwargs.pop('chunksize', None)
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        version = self._db_version()
+        cached = self._cache.get(key)
+        
+        if chunksize is not None:
+            if cached is not None and cached[0] == version:
+                frame = cached[1]
+                return (frame.iloc[i:i + chunksize] for i in range(0, max(len(frame), 1), chunksize))
+            return method(self, *args, chunksize=chunksize, **kwargs)
+        
+        if cached is None or cached[0] != version:
+            cached = (version, method(self, *args, **kwargs))
+            self._cache[key] = cached
+        return cached[1].copy()
+    return wrapper
+
 class MultiPortalAnalyzer:
     """Analyze combined data from all portals"""
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._conn = None
+        self._adbc_conn = None
+        self._s_no_sort = None
+        self._cache = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        """Get the cached connection, opening it on first use"""
+        if self._conn is None:
+            self._conn = open_connection(self.db_path)
+        return self._conn
+    
+    def get_arrow_connection(self):
+        """Get the cached ADBC connection, or None when the driver is not installed"""
+        if not ADBC_AVAILABLE:
+            return None
+        if self._adbc_conn is None:
+            # Autocommit: otherwise the driver holds one read transaction for the
+            # analyzer's lifetime, pinning every read to the first snapshot and
+            # keeping the writers from checkpointing the WAL
+            self._adbc_conn = adbc_sqlite.connect(read_only_uri(self.db_path), autocommit=True)
+            with self._adbc_conn.cursor() as cursor:
+                for pragma in CONNECTION_PRAGMAS:
+                    cursor.execute(pragma)
+        return self._adbc_conn
+    
+    def _read_frame(self, query: str) -> pd.DataFrame:
+        """Read a full result set, straight into Arrow buffers when ADBC is available"""
+        adbc_conn = self.get_arrow_connection()
+        if adbc_conn is not None:
+            return pd.read_sql(query, adbc_conn, dtype_backend='pyarrow')
+        return pd.read_sql_query(query, self.get_connection())
+    
+    def _sort_sql(self, query: str) -> str:
+        """Fill the {s_no_sort} placeholder for this database's schema"""
+        if self._s_no_sort is None:
+            self._s_no_sort = s_no_sort_expression(self.get_connection())
+        return query.format(s_no_sort=self._s_no_sort)
+    
+    def _db_version(self) -> int:
+        """Changes whenever another connection commits to the database"""
+        return self.get_connection().execute("PRAGMA data_version").fetchone()[0]
     
+    def close(self):
+        """Close the cached connections and drop cached results"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._adbc_conn is not None:
+            self._adbc_conn.close()
+            self._adbc_conn = None
+        self._s_no_sort = None
+        self._cache.clear()
+    
+    @_cached_query
     def get_combined_statistics(self) -> pd.DataFrame:
-        """Get statistics for all portals combined"""
-        query = """
-        SELECT 
-            portal_id as 'Portal ID',
-            portal_source as 'Portal Name',
-            COUNT(*) as 'Total Extracted',
-            SUM(CASE WHEN ai_filtered = 1 THEN 1 ELSE 0 END) as 'AI Kept',
-            SUM(CASE WHEN ai_filtered = -1 THEN 1 ELSE 0 END) as 'AI Filtered',
-            SUM(CASE WHEN phase2_status = 'success' THEN 1 ELSE 0 END) as 'Phase 2 Success',
-            SUM(CASE WHEN phase2_status = 'failed' THEN 1 ELSE 0 END) as 'Phase 2 Failed',
-            SUM(CASE WHEN phase2_status = 'pending' THEN 1 ELSE 0 END) as 'Phase 2 Pending'
-        FROM tenders
-        GROUP BY portal_id, portal_source
-        ORDER BY portal_id
-        """
-        
-        conn = self.get_connection()
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        
-        # Add totals row
-        totals = pd.DataFrame([{
-            'Portal ID': 'TOTAL',
-            'Portal Name': 'All Portals',
-            'Total Extracted': df['Total Extracted'].sum(),
-            'AI Kept': df['AI Kept'].sum(),
-            'AI Filtered': df['AI Filtered'].sum(),
-            'Phase 2 Success': df['Phase 2 Success'].sum(),
-            'Phase 2 Failed': df['Phase 2 Failed'].sum(),
-            'Phase 2 Pending': df['Phase 2 Pending'].sum()
-        }])
-        
-        df = pd.concat([df, totals], ignore_index=True)
-        
-        return df
+        """Get statistics for all portals combined, with a TOTAL row computed in SQL"""
+        return self._read_frame(COMBINED_STATISTICS_SQL)
     
-    def get_all_kept_tenders(self) -> pd.DataFrame:
-        """Get all tenders that were kept after AI filtering"""
-        query = """
-        SELECT 
-            portal_id as 'Portal ID',
-            portal_source as 'Portal Source',
-            s_no as 'S.No.',
-            title as 'Title',
-            work_description as 'Work Description',
-            e_published_date as 'e-Published Date',
-            closing_date as 'Closing Date',
-            opening_date as 'Opening Date',
-            org_chain as 'Organisation',
-            details_url as 'Details URL',
-            phase2_status as 'Phase 2 Status'
-        FROM tenders
-        WHERE ai_filtered = 1
-        ORDER BY portal_id, CAST(s_no AS INTEGER)
+    @_cached_query
+    def get_all_kept_tenders(self, *, chunksize: Optional[int] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
-        
-        conn = self.get_connection()
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        
-        return df
+        Get all tenders that were kept after AI filtering.
+        With chunksize, returns an iterator of DataFrames instead of one frame.
+        """
+        if chunksize is not None:
+            # ADBC has no chunked reads in pandas; stream through sqlite3
+            return pd.read_sql_query(self._sort_sql(KEPT_TENDERS_SQL), self.get_connection(), chunksize=chunksize)
+        return self._read_frame(self._sort_sql(KEPT_TENDERS_SQL))
     
-    def get_execution_history(self) -> pd.DataFrame:
-        """Get execution history for all portals"""
-        query = """
-        SELECT 
-            portal_id as 'Portal ID',
-            datetime(execution_start) as 'Start Time',
-            datetime(execution_end) as 'End Time',
-            ROUND((julianday(execution_end) - julianday(execution_start)) * 24 * 60, 1) as 'Duration (min)',
-            status as 'Status',
-            total_extracted as 'Extracted',
-            total_kept as 'Kept',
-            phase2_success as 'P2 Success',
-            phase2_failed as 'P2 Failed',
-            error_message as 'Error'
-        FROM portal_execution_log
-        ORDER BY execution_start DESC
+    @_cached_query
+    def get_execution_history(self, *, chunksize: Optional[int] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
-        
-        conn = self.get_connection()
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        
-        return df
+        Get execution history for all portals.
+        With chunksize, returns an iterator of DataFrames instead of one frame.
+        """
+        if chunksize is not None:
+            # ADBC has no chunked reads in pandas; stream through sqlite3
+            return pd.read_sql_query(EXECUTION_HISTORY_SQL, self.get_connection(), chunksize=chunksize)
+        return self._read_frame(EXECUTION_HISTORY_SQL)
     
+    @_cached_query
     def get_failed_urls_summary(self) -> pd.DataFrame:
         """Get summary of failed URLs by portal"""
-        query = """
-        SELECT 
-            f.portal_id as 'Portal ID',
-            COUNT(*) as 'Failed Count',
-            GROUP_CONCAT(DISTINCT f.failure_reason) as 'Failure Reasons'
-        FROM failed_urls f
-        WHERE f.status = 'failed'
-        GROUP BY f.portal_id
-        ORDER BY COUNT(*) DESC
-        """
-        
-        conn = self.get_connection()
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        
-        return df
+        return self._read_frame(FAILED_URLS_SUMMARY_SQL)
     
+    @_cached_query
     def get_tenders_by_closing_date(self, days_ahead: int = 7) -> pd.DataFrame:
         """Get tenders closing within N days across all portals"""
-        query = """
-        SELECT 
-            portal_id as 'Portal ID',
-            portal_source as 'Portal',
-            title as 'Title',
-            closing_date as 'Closing Date',
-            org_chain as 'Organisation',
-            details_url as 'URL'
-        FROM tenders
-        WHERE ai_filtered = 1
-        AND phase2_status = 'success'
-        ORDER BY closing_date
+        return self._read_frame(CLOSING_TENDERS_SQL)
+    
+    def _rows_for(self, sql: str, columns: dict, limit: Optional[int] = None):
         """
-        
-        conn = self.get_connection()
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        
-        return df
+        Fetch raw rows for console output, keeping only the columns in `columns`.
+        Returns (display headers, rows) - no DataFrame for a handful of rows.
+        """
+        cursor = self.get_connection().execute(sql)
+        names = [d[0] for d in cursor.description]
+        keep = [names.index(c) for c in columns]
+        rows = cursor.fetchall() if limit is None else cursor.fetchmany(limit)
+        cursor.close()
+        return list(columns.values()), [tuple(row[i] for i in keep) for row in rows]
+    
+    def _write_chunks(self, append_row, chunks: Iterator[pd.DataFrame], columns: dict) -> int:
+        """
+        Append DataFrame chunks to one sheet row by row through `append_row`,
+        writing the header once with display names from `columns`.
+        Both streaming writers only keep the current row, so rows must arrive in order.
+        """
+        rows_written = 0
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                append_row([columns.get(c, c) for c in chunk.columns])
+            values = chunk.astype(object).where(chunk.notna(), None)
+            for row in values.itertuples(index=False, name=None):
+                append_row(row)
+                rows_written += 1
+        return rows_written
     
     def export_combined_excel(self, output_path: str):
         """Export combined data to Excel with multiple sheets"""
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            # Sheet 1: Statistics
-            stats_df = self.get_combined_statistics()
-            stats_df.to_excel(writer, sheet_name='Statistics', index=False)
+        if XLSXWRITER_AVAILABLE:
+            book = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'strings_to_urls': False})
+            
+            def add_sheet(name):
+                worksheet = book.add_worksheet(name)
+                row_numbers = itertools.count()
+                return lambda row: worksheet.write_row(next(row_numbers), 0, row)
             
-            # Sheet 2: All Kept Tenders
-            tenders_df = self.get_all_kept_tenders()
-            tenders_df.to_excel(writer, sheet_name='All Kept Tenders', index=False)
+            finish = book.close
+        else:
+            book = Workbook(write_only=True)
             
-            # Sheet 3: Execution History
-            history_df = self.get_execution_history()
-            history_df.to_excel(writer, sheet_name='Execution History', index=False)
+            def add_sheet(name):
+                return book.create_sheet(name).append
             
-            # Sheet 4: Failed URLs Summary
-            failed_df = self.get_failed_urls_summary()
-            if not failed_df.empty:
-                failed_df.to_excel(writer, sheet_name='Failed URLs', index=False)
+            def finish():
+                book.save(output_path)
         
+        # Sheet 1: Statistics
+        self._write_chunks(add_sheet('Statistics'), [self.get_combined_statistics()],
+                           STATISTICS_COLUMNS)
+        
+        # Sheet 2: All Kept Tenders (streamed in chunks)
+        self._write_chunks(add_sheet('All Kept Tenders'),
+                           self.get_all_kept_tenders(chunksize=EXPORT_CHUNK_SIZE),
+                           KEPT_TENDERS_COLUMNS)
+        
+        # Sheet 3: Execution History (streamed in chunks)
+        self._write_chunks(add_sheet('Execution History'),
+                           self.get_execution_history(chunksize=EXPORT_CHUNK_SIZE),
+                           EXECUTION_HISTORY_COLUMNS)
+        
+        # Sheet 4: Failed URLs Summary
+        failed_df = self.get_failed_urls_summary()
+        if not failed_df.empty:
+            self._write_chunks(add_sheet('Failed URLs'), [failed_df], FAILED_URLS_COLUMNS)
+        
+        finish()
         print(f"✓ Combined report exported to: {output_path}")
     
     def print_summary(self):
@@ -179,26 +492,28 @@ class MultiPortalAnalyzer:
         print("="*80 + "\n")
         
         # Statistics
-        stats_df = self.get_combined_statistics()
+        headers, rows = self._rows_for(COMBINED_STATISTICS_SQL, STATISTICS_COLUMNS)
         print("Statistics by Portal:")
-        print(stats_df.to_string(index=False))
+        print(_format_rows(headers, rows))
         
         # Execution history
         print("\n" + "-"*80)
         print("Latest Execution:")
         print("-"*80)
-        history_df = self.get_execution_history()
-        if not history_df.empty:
-            latest = history_df.head(4)  # Show latest run for each portal
-            print(latest[['Portal ID', 'Duration (min)', 'Status', 'Extracted', 'Kept']].to_string(index=False))
+        history_columns = {c: EXECUTION_HISTORY_COLUMNS[c] for c in
+                           ('portal_id', 'duration_min', 'status', 'total_extracted', 'total_kept')}
+        headers, rows = self._rows_for(EXECUTION_HISTORY_SQL, history_columns, limit=4)  # Latest run per portal
+        if rows:
+            print(_format_rows(headers, rows))
         
         # Failed URLs
         print("\n" + "-"*80)
         print("Failed URLs Summary:")
         print("-"*80)
-        failed_df = self.get_failed_urls_summary()
-        if not failed_df.empty:
-            print(failed_df[['Portal ID', 'Failed Count']].to_string(index=False))
+        failed_columns = {c: FAILED_URLS_COLUMNS[c] for c in ('portal_id', 'failed_count')}
+        headers, rows = self._rows_for(FAILED_URLS_SUMMARY_SQL, failed_columns)
+        if rows:
+            print(_format_rows(headers, rows))
         else:
             print("No failed URLs")
         
@@ -206,103 +521,62 @@ class MultiPortalAnalyzer:
 
 # ======================= SPECIFIC QUERIES =======================
 
-def query_portal_specific(db_path: str, portal_id: str) -> pd.DataFrame:
+def query_portal_specific(db_path: str, portal_id: str, conn: Optional[sqlite3.Connection] = None) -> pd.DataFrame:
     """Query data for a specific portal"""
-    query = f"""
-    SELECT 
-        s_no as 'S.No.',
-        title as 'Title',
-        work_description as 'Work Description',
-        closing_date as 'Closing Date',
-        org_chain as 'Organisation'
-    FROM tenders
-    WHERE portal_id = '{portal_id}'
-    AND ai_filtered = 1
-    ORDER BY CAST(s_no AS INTEGER)
-    """
-    
-    conn = sqlite3.connect(db_path)
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    
-    return df
+    return _read_query(db_path, PORTAL_TENDERS_SQL, conn, params=(portal_id,))
 
-def query_tenders_by_keyword(db_path: str, keyword: str) -> pd.DataFrame:
-    """Search tenders across all portals by keyword"""
-    query = f"""
-    SELECT 
-        portal_id as 'Portal',
-        title as 'Title',
-        work_description as 'Work Description',
-        closing_date as 'Closing Date',
-        details_url as 'URL'
-    FROM tenders
-    WHERE ai_filtered = 1
-    AND (
-        LOWER(title) LIKE '%{keyword.lower()}%'
-        OR LOWER(work_description) LIKE '%{keyword.lower()}%'
-    )
-    ORDER BY portal_id, closing_date
-    """
-    
-    conn = sqlite3.connect(db_path)
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    
-    return df
+def query_tenders_by_keyword(db_path: str, keyword: str, conn: Optional[sqlite3.Connection] = None) -> pd.DataFrame:
+    """Search tenders across all portals by keyword (case-insensitive)"""
+    pattern = f"%{keyword}%"
+    return _read_query(db_path, KEYWORD_SEARCH_SQL, conn, params=(pattern, pattern))
 
-def compare_portals_performance(db_path: str) -> pd.DataFrame:
-    """Compare extraction and success rates across portals"""
-    query = """
-    SELECT 
-        portal_id as 'Portal',
-        COUNT(*) as 'Total Tenders',
-        SUM(CASE WHEN ai_filtered = 1 THEN 1 ELSE 0 END) as 'Kept',
-        ROUND(SUM(CASE WHEN ai_filtered = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 1) as 'Keep Rate %',
-        SUM(CASE WHEN phase2_status = 'success' THEN 1 ELSE 0 END) as 'Phase 2 Success',
-        ROUND(SUM(CASE WHEN phase2_status = 'success' THEN 1 ELSE 0 END) * 100.0 / 
-              NULLIF(SUM(CASE WHEN ai_filtered = 1 THEN 1 ELSE 0 END), 0), 1) as 'Success Rate %'
-    FROM tenders
-    GROUP BY portal_id
-    ORDER BY portal_id
+def compare_portals_performance(analyzer: MultiPortalAnalyzer) -> pd.DataFrame:
     """
-    
-    conn = sqlite3.connect(db_path)
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    
-    return df
+    Compare extraction and success rates across portals.
+    Derived from the (cached) combined statistics instead of re-scanning tenders.
+    """
+    stats = analyzer.get_combined_statistics()
+    perf = (stats[stats['portal_id'] != 'TOTAL']
+            .groupby('portal_id', as_index=False)[['total_extracted', 'ai_kept', 'phase2_success']]
+            .sum()
+            .rename(columns={'total_extracted': 'total_tenders', 'ai_kept': 'kept'}))
+    kept = perf['kept']
+    perf['keep_rate_pct'] = (kept * 100 / perf['total_tenders']).round(1)
+    perf['success_rate_pct'] = (perf['phase2_success'] * 100 / kept.where(kept > 0)).round(1)
+    return perf[list(PORTAL_PERFORMANCE_COLUMNS)]
 
 # ======================= MAIN =======================
 
 if __name__ == "__main__":
-    # Create analyzer
-    analyzer = MultiPortalAnalyzer(DATABASE_PATH)
-    
-    # Print summary
-    analyzer.print_summary()
-    
-    # Export combined report
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"combined_report_{timestamp}.xlsx"
-    analyzer.export_combined_excel(output_file)
-    
-    # Print performance comparison
-    print("\n" + "="*80)
-    print("PORTAL PERFORMANCE COMPARISON")
-    print("="*80)
-    perf_df = compare_portals_performance(DATABASE_PATH)
-    print(perf_df.to_string(index=False))
-    print("="*80 + "\n")
-    
-    # Example: Search for specific keywords
-    print("\n" + "="*80)
-    print("EXAMPLE: Search for 'solar' tenders")
-    print("="*80)
-    solar_df = query_tenders_by_keyword(DATABASE_PATH, 'solar')
-    if not solar_df.empty:
-        print(f"Found {len(solar_df)} tenders containing 'solar':")
-        print(solar_df[['Portal', 'Title']].head(10).to_string(index=False))
-    else:
-        print("No results found")
-    print("="*80 + "\n")
+    # One analyzer connection (and one warm page cache) for every report below
+    with MultiPortalAnalyzer(DATABASE_PATH) as analyzer:
+        conn = analyzer.get_connection()
+        
+        # Print summary
+        analyzer.print_summary()
+        
+        # Export combined report
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"combined_report_{timestamp}.xlsx"
+        analyzer.export_combined_excel(output_file)
+        
+        # Print performance comparison
+        print("\n" + "="*80)
+        print("PORTAL PERFORMANCE COMPARISON")
+        print("="*80)
+        perf_df = compare_portals_performance(analyzer)
+        print(perf_df.rename(columns=PORTAL_PERFORMANCE_COLUMNS).to_string(index=False))
+        print("="*80 + "\n")
+        
+        # Example: Search for specific keywords
+        print("\n" + "="*80)
+        print("EXAMPLE: Search for 'solar' tenders")
+        print("="*80)
+        solar_df = query_tenders_by_keyword(DATABASE_PATH, 'solar', conn=conn)
+        if not solar_df.empty:
+            print(f"Found {len(solar_df)} tenders containing 'solar':")
+            solar_df = solar_df[['portal_id', 'title']].head(10)
+            print(solar_df.rename(columns=KEYWORD_SEARCH_COLUMNS).to_string(index=False))
+        else:
+            print("No results found")
+        print("="*80 + "\n")
@@ -1,12 +1,13 @@
 """
 PRODUCTION MULTI-PORTAL ORCHESTRATOR
 =====================================
-Runs all 4 portals (WB, BHEL, COAL, NTPC) with 5-second staggered start.
+Runs all 4 portals (WB, BHEL, COAL, NTPC) with a staggered start: each portal
+starts once the previous one has launched its browser (at most 5 seconds apart).
 NO PAGE LIMITS - scrapes all available data.
 """
 
 import multiprocessing
-import time
+import multiprocessing.connection
 import os
 from datetime import datetime
 from production_portal_scraper import IsolatedPortalScraper, PORTALS
@@ -23,7 +24,7 @@ MISTRAL_API_KEY = os.getenv("MISTRAL_API_KEY", "")
 # PRODUCTION MODE: No page limits
 # (test_pages parameter removed from production version)
 
-# Stagger delay between portal starts
+# Maximum stagger between portal starts (cut short once the previous portal is ready)
 PORTAL_START_DELAY = 5  # seconds
 
 # ======================= SETUP =======================
@@ -42,11 +43,14 @@ logger = logging.getLogger(__name__)
 
 # ======================= PORTAL RUNNER =======================
 
-def run_portal_instance(portal_id: str, db_path: str, api_key: str):
+def run_portal_instance(portal_id: str, db_path: str, api_key: str, ready_event=None):
     """
     Run a single portal instance in isolated process.
     PRODUCTION MODE: Unlimited pagination.
+    ready_event is set once the portal's browser is up, so the orchestrator
+    can start the next portal without waiting out the full stagger delay.
     """
+    scraper = None
     try:
         config = PORTALS[portal_id]
         
@@ -58,7 +62,7 @@ def run_portal_instance(portal_id: str, db_path: str, api_key: str):
         )
         
         # Run the scraper (unlimited)
-        result = scraper.run()
+        result = scraper.run(ready_event=ready_event)
         
         return {
             'portal_id': portal_id,
@@ -74,123 +78,182 @@ def run_portal_instance(portal_id: str, db_path: str, api_key: str):
             'error': str(e),
             'traceback': traceback.format_exc()
         }
+    
+    finally:
+        if scraper is not None:
+            scraper.close()
+        # Never leave the orchestrator waiting on a portal that failed to start
+        if ready_event is not None:
+            ready_event.set()
+
+def _portal_process_main(portal_id: str, db_path: str, api_key: str, ready_event, result_conn):
+    """Process entry point: run one portal and send its result dict back over the pipe"""
+    try:
+        result_conn.send(run_portal_instance(portal_id, db_path, api_key, ready_event))
+    finally:
+        result_conn.close()
 
 # ======================= ORCHESTRATOR =======================
 
+def _receive_result(portal_info: dict):
+    """Store the result dict sent by a portal process; EOF means it died without one"""
+    try:
+        portal_info['result'] = portal_info['conn'].recv()
+    except EOFError:
+        pass
+
 def run_all_portals():
     """
     Orchestrate all 4 portals with staggered start.
     PRODUCTION MODE: Each portal runs until end of data.
     """
-    logger.info("="*80)
-    logger.info("PRODUCTION MULTI-PORTAL ORCHESTRATOR")
-    logger.info("="*80)
-    logger.info(f"Database: {DATABASE_PATH}")
-    logger.info("Mode: PRODUCTION (Unlimited pagination)")
-    logger.info(f"Portal start delay: {PORTAL_START_DELAY} seconds")
-    logger.info(f"Portals: {', '.join(PORTALS.keys())}")
-    logger.info("  - WB: West Bengal")
-    logger.info("  - BHEL: BHEL (REPLACES BEL)")
-    logger.info("  - COAL: Coal India")
-    logger.info("  - NTPC: NTPC (with alert dialog handling)")
-    logger.info("="*80 + "\n")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 80)
+        logger.info("PRODUCTION MULTI-PORTAL ORCHESTRATOR")
+        logger.info("=" * 80)
+        logger.info("Database: %s", DATABASE_PATH)
+        logger.info("Mode: PRODUCTION (Unlimited pagination)")
+        logger.info("Portal start delay: up to %s seconds", PORTAL_START_DELAY)
+        logger.info("Portals: %s", ', '.join(PORTALS.keys()))
+        logger.info("  - WB: West Bengal")
+        logger.info("  - BHEL: BHEL (REPLACES BEL)")
+        logger.info("  - COAL: Coal India")
+        logger.info("  - NTPC: NTPC (with alert dialog handling)")
+        logger.info("%s\n", "=" * 80)
     
-    processes = []
     portal_order = list(PORTALS.keys())
+    completed = []
+    failed = []
     
     start_time = datetime.now()
     
-    # Start each portal with 5-second delay
+    mp_context = multiprocessing.get_context('spawn')
+    processes = []
+    
+    # One process per portal, so a crash (OOM, segfault, SIGKILL) only takes its own portal down.
+    # Start each portal once the previous one is ready (capped at PORTAL_START_DELAY)
     for idx, portal_id in enumerate(portal_order):
-        logger.info(f"\n{'='*80}")
-        logger.info(f"Starting Portal {idx+1}/4: {PORTALS[portal_id].name} ({portal_id})")
-        logger.info(f"{'='*80}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", "=" * 80)
+            logger.info("Starting Portal %d/%d: %s (%s)",
+                        idx + 1, len(portal_order), PORTALS[portal_id].name, portal_id)
+            logger.info("=" * 80)
         
-        process = multiprocessing.Process(
-            target=run_portal_instance,
-            args=(portal_id, DATABASE_PATH, MISTRAL_API_KEY),
+        ready = mp_context.Event()
+        result_conn, child_conn = mp_context.Pipe(duplex=False)
+        process = mp_context.Process(
+            target=_portal_process_main,
+            args=(portal_id, DATABASE_PATH, MISTRAL_API_KEY, ready, child_conn),
             name=f"Portal_{portal_id}"
         )
-        
         process.start()
+        # Drop our copy of the write end, so the pipe reports EOF if the child dies
+        child_conn.close()
+        
         processes.append({
             'process': process,
+            'conn': result_conn,
+            'result': None,
             'portal_id': portal_id,
             'name': PORTALS[portal_id].name,
             'start_time': datetime.now()
         })
         
-        logger.info(f"✓ Process started for {PORTALS[portal_id].name}")
-        logger.info(f"  PID: {process.pid}")
+        logger.info("✓ Process started for %s", PORTALS[portal_id].name)
+        logger.info("  PID: %s", process.pid)
         
         if idx < len(portal_order) - 1:
-            logger.info(f"\n⏳ Waiting {PORTAL_START_DELAY} seconds before starting next portal...")
-            time.sleep(PORTAL_START_DELAY)
-    
-    logger.info(f"\n{'='*80}")
-    logger.info("ALL PORTALS STARTED")
-    logger.info(f"{'='*80}")
-    logger.info(f"Active processes: {len(processes)}")
-    for p in processes:
-        logger.info(f"  - {p['name']} ({p['portal_id']}): PID {p['process'].pid}")
-    logger.info(f"{'='*80}\n")
+            logger.info("\n⏳ Waiting for %s to launch (max %s seconds)...",
+                        PORTALS[portal_id].name, PORTAL_START_DELAY)
+            if not ready.wait(timeout=PORTAL_START_DELAY):
+                logger.info("  Not ready yet - starting next portal anyway")
     
-    logger.info("Monitoring portal execution...")
-    logger.info("(Production mode: May take 2-4 hours per portal)\n")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n%s", "=" * 80)
+        logger.info("ALL PORTALS STARTED")
+        logger.info("=" * 80)
+        logger.info("Active processes: %d", len(processes))
+        for portal_info in processes:
+            logger.info("  - %s (%s): PID %s", portal_info['name'], portal_info['portal_id'],
+                        portal_info['process'].pid)
+        logger.info("%s\n", "=" * 80)
+        
+        logger.info("Monitoring portal execution...")
+        logger.info("(Production mode: May take 2-4 hours per portal)\n")
     
-    completed = []
-    failed = []
+    # Block on the result pipes and process sentinels - no polling. Pipes are read as
+    # soon as they are readable, so a child never blocks on a full pipe buffer.
+    waitables = {}
+    for portal_info in processes:
+        waitables[portal_info['conn']] = portal_info
+        waitables[portal_info['process'].sentinel] = portal_info
     
-    while any(p['process'].is_alive() for p in processes):
-        for portal_info in processes:
+    while waitables:
+        for ready_obj in multiprocessing.connection.wait(list(waitables)):
+            portal_info = waitables.pop(ready_obj)
+            conn = portal_info['conn']
+            
+            if ready_obj is conn:
+                _receive_result(portal_info)
+                continue
+            
+            # Process exited; pick up a result that arrived in the same wakeup
+            if conn in waitables:
+                del waitables[conn]
+                if conn.poll():
+                    _receive_result(portal_info)
+            conn.close()
+            
             process = portal_info['process']
+            process.join()
             portal_id = portal_info['portal_id']
+            duration = (datetime.now() - portal_info['start_time']).total_seconds()
             
-            if not process.is_alive() and portal_id not in [c['portal_id'] for c in completed + failed]:
-                end_time = datetime.now()
-                duration = (end_time - portal_info['start_time']).total_seconds()
-                
-                if process.exitcode == 0:
-                    completed.append({
-                        'portal_id': portal_id,
-                        'name': portal_info['name'],
-                        'duration': duration
-                    })
-                    logger.info(f"✓ {portal_info['name']} ({portal_id}) completed successfully")
-                    logger.info(f"  Duration: {duration/60:.1f} minutes ({duration/3600:.1f} hours)")
-                else:
-                    failed.append({
-                        'portal_id': portal_id,
-                        'name': portal_info['name'],
-                        'exitcode': process.exitcode
-                    })
-                    logger.error(f"✗ {portal_info['name']} ({portal_id}) failed with exit code {process.exitcode}")
-        
-        time.sleep(5)
+            result = portal_info['result'] or {
+                'portal_id': portal_id,
+                'status': 'error',
+                'error': f"Process exited with code {process.exitcode} before returning a result"
+            }
+            
+            if result['status'] == 'success':
+                completed.append({
+                    'portal_id': portal_id,
+                    'name': portal_info['name'],
+                    'duration': duration
+                })
+                logger.info("✓ %s (%s) completed successfully", portal_info['name'], portal_id)
+                logger.info("  Duration: %.1f minutes (%.1f hours)", duration / 60, duration / 3600)
+            else:
+                failed.append({
+                    'portal_id': portal_id,
+                    'name': portal_info['name'],
+                    'error': result.get('error')
+                })
+                logger.error("✗ %s (%s) failed: %s", portal_info['name'], portal_id, result.get('error'))
     
     total_duration = (datetime.now() - start_time).total_seconds()
     
-    logger.info(f"\n{'='*80}")
-    logger.info("ALL PORTALS COMPLETED")
-    logger.info(f"{'='*80}")
-    logger.info(f"Total execution time: {total_duration/60:.1f} minutes ({total_duration/3600:.1f} hours)")
-    logger.info(f"Successful: {len(completed)}/{len(processes)}")
-    logger.info(f"Failed: {len(failed)}/{len(processes)}")
-    
-    if completed:
-        logger.info("\n✓ Successful portals:")
-        for portal in completed:
-            logger.info(f"  - {portal['name']} ({portal['portal_id']}): {portal['duration']/60:.1f} min")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n%s", "=" * 80)
+        logger.info("ALL PORTALS COMPLETED")
+        logger.info("=" * 80)
+        logger.info("Total execution time: %.1f minutes (%.1f hours)",
+                    total_duration / 60, total_duration / 3600)
+        logger.info("Successful: %d/%d", len(completed), len(portal_order))
+        logger.info("Failed: %d/%d", len(failed), len(portal_order))
+        
+        if completed:
+            logger.info("\n✓ Successful portals:")
+            for portal in completed:
+                logger.info("  - %s (%s): %.1f min",
+                            portal['name'], portal['portal_id'], portal['duration'] / 60)
     
     if failed:
         logger.error("\n✗ Failed portals:")
         for portal in failed:
-            logger.error(f"  - {portal['name']} ({portal['portal_id']}): Exit code {portal['exitcode']}")
+            logger.error("  - %s (%s): %s", portal['name'], portal['portal_id'], portal['error'])
     
-    logger.info(f"{'='*80}\n")
-    
-    for portal_info in processes:
-        portal_info['process'].join(timeout=5)
+    logger.info("%s\n", "=" * 80)
     
     return {
         'completed': completed,
@@ -204,66 +267,72 @@ def analyze_portal_errors(db_path: str):
     """Analyze errors from portal execution logs"""
     import sqlite3
     
-    logger.info("\n" + "="*80)
-    logger.info("ERROR ANALYSIS")
-    logger.info("="*80)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n%s", "=" * 80)
+        logger.info("ERROR ANALYSIS")
+        logger.info("=" * 80)
     
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
-    # Get latest execution for each portal
+    # Latest execution per portal joined with its failed URL count
     cursor.execute("""
-        SELECT portal_id, status, error_message, 
-               total_extracted, phase2_success, phase2_failed, pages_scraped
-        FROM portal_execution_log
-        WHERE id IN (
-            SELECT MAX(id) FROM portal_execution_log GROUP BY portal_id
-        )
-        ORDER BY portal_id
+        SELECT e.portal_id, e.status, e.error_message,
+               e.total_extracted, e.phase2_success, e.phase2_failed, e.pages_scraped,
+               COALESCE(f.failed_count, 0)
+        FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY portal_id ORDER BY id DESC) AS rn
+            FROM portal_execution_log
+        ) e
+        LEFT JOIN (
+            SELECT portal_id, COUNT(*) AS failed_count
+            FROM failed_urls
+            WHERE status = 'failed'
+            GROUP BY portal_id
+        ) f USING (portal_id)
+        WHERE e.rn = 1
+        ORDER BY e.portal_id
     """)
     
     results = cursor.fetchall()
+    conn.close()
     
     if not results:
         logger.info("No execution logs found")
-        conn.close()
         return
     
     for row in results:
-        portal_id, status, error_msg, extracted, p2_success, p2_failed, pages = row
+        portal_id, status, error_msg, extracted, p2_success, p2_failed, pages, _ = row
         
-        logger.info(f"\n{portal_id}:")
-        logger.info(f"  Status: {status}")
-        logger.info(f"  Pages scraped: {pages}")
-        logger.info(f"  Extracted: {extracted}")
-        logger.info(f"  Phase 2: {p2_success} success, {p2_failed} failed")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s:", portal_id)
+            logger.info("  Status: %s", status)
+            logger.info("  Pages scraped: %s", pages)
+            logger.info("  Extracted: %s", extracted)
+            logger.info("  Phase 2: %s success, %s failed", p2_success, p2_failed)
         
         if error_msg:
-            logger.error(f"  Error: {error_msg}")
+            logger.error("  Error: %s", error_msg)
     
-    # Check for failed URLs per portal
-    logger.info("\n" + "-"*80)
-    logger.info("Failed URLs by Portal:")
-    logger.info("-"*80)
+    # Failed URLs per portal, from the same result set
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n%s", "-" * 80)
+        logger.info("Failed URLs by Portal:")
+        logger.info("-" * 80)
     
-    cursor.execute("""
-        SELECT portal_id, COUNT(*) as failed_count
-        FROM failed_urls
-        WHERE status = 'failed'
-        GROUP BY portal_id
-        ORDER BY failed_count DESC
-    """)
-    
-    failed_urls = cursor.fetchall()
+    failed_urls = sorted(
+        ((row[0], row[7]) for row in results if row[7]),
+        key=lambda item: item[1],
+        reverse=True
+    )
     
     if failed_urls:
         for portal_id, count in failed_urls:
-            logger.info(f"  {portal_id}: {count} failed URLs")
+            logger.info("  %s: %s failed URLs", portal_id, count)
     else:
         logger.info("  No failed URLs")
     
-    conn.close()
-    logger.info("="*80 + "\n")
+    logger.info("%s\n", "=" * 80)
 
 # ======================= MAIN =======================
 
@@ -278,13 +347,14 @@ if __name__ == "__main__":
         analyze_portal_errors(DATABASE_PATH)
         
         # Print summary
-        logger.info("\n" + "="*80)
-        logger.info("EXECUTION SUMMARY")
-        logger.info("="*80)
-        logger.info(f"Database: {DATABASE_PATH}")
-        logger.info(f"Portal logs: portals/[PORTAL_ID]/logs/")
-        logger.info(f"Excel outputs: portals/[PORTAL_ID]/excel_mirrors/")
-        logger.info("="*80)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", "=" * 80)
+            logger.info("EXECUTION SUMMARY")
+            logger.info("=" * 80)
+            logger.info("Database: %s", DATABASE_PATH)
+            logger.info("Portal logs: portals/[PORTAL_ID]/logs/")
+            logger.info("Excel outputs: portals/[PORTAL_ID]/excel_mirrors/")
+            logger.info("=" * 80)
         
         if results['failed']:
             logger.error("\n⚠️  Some portals failed. Check logs for details.")
@@ -299,7 +369,7 @@ if __name__ == "__main__":
         exit(130)
     
     except Exception as e:
-        logger.error(f"\n✗ Fatal orchestrator error: {e}")
+        logger.error("\n✗ Fatal orchestrator error: %s", e)
         import traceback
         logger.error(traceback.format_exc())
         exit(1)
@@ -13,14 +13,23 @@ Features:
 """
 
 from playwright.sync_api import sync_playwright, Page, BrowserContext
-import pandas as pd
+from playwright.async_api import async_playwright, Page as AsyncPage, BrowserContext as AsyncBrowserContext
+from openpyxl import Workbook
+import asyncio
 import sqlite3
 import time
 import os
+import random
+import re
+import threading
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional
+import logging.handlers
+import queue
+from typing import Dict, Iterator, List, Optional
 import json
 from pathlib import Path
 
@@ -31,6 +40,34 @@ try:
 except ImportError:
     MISTRAL_AVAILABLE = False
 
+# Any run of whitespace, collapsed to one space by clean_text
+_WS_RE = re.compile(r'\s+')
+
+# JSON object wrapped in a Markdown code fence (fallback for AI responses)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.S)
+
+# Playwright errors worth retrying: the element went stale or was detached
+_STALE_RE = re.compile(r'stale|detached', re.I)
+
+# Phase 2 results that record a failure instead of a work description
+_FAILURE_RE = re.compile(r'ERROR|FETCH|WORK_DESCRIPTION')
+
+def clean_cell(text: str) -> str:
+    """Collapse every whitespace run to one space and trim (clean_text's rule)"""
+    if not text:
+        return ""
+    return _WS_RE.sub(' ', text).strip()
+
+def tender_identity_hash(title: str, e_published: str, org_chain: str) -> str:
+    """Deduplication key for a tender, from its cleaned title, publish date and organisation"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(title.encode())
+    h.update(b'\x1f')
+    h.update(e_published.encode())
+    h.update(b'\x1f')
+    h.update(org_chain.encode())
+    return h.hexdigest()
+
 # ======================= PORTAL CONFIGURATION =======================
 
 class PortalConfig:
@@ -97,343 +134,556 @@ PORTALS = {
 # ======================= ISOLATED AI CHECKER =======================
 
 class IsolatedAIChecker:
-    """AI checker with ISOLATED cache per portal instance"""
+    """
+    AI checker with ISOLATED cache per portal instance.
+    When a database manager is given, verdicts also persist in its
+    ai_title_cache table, so reruns don't re-classify known titles.
+    """
     
-    def __init__(self, portal_id: str, api_key: str):
+    BATCH_SIZE = 50   # titles per Mistral request
+    MAX_WORKERS = 8   # concurrent requests, kept low for Mistral rate limits
+    MAX_RETRIES = 3   # retries per request on HTTP 429
+    
+    # Static parts of the classification prompt; the numbered titles go between them
+    _PROMPT_HEADER = """Analyze these tender titles. Classify as "meaningful" or "unmeaningful".
+
+MEANINGFUL: Has descriptive English words about the tender
+UNMEANINGFUL: Only codes/IDs/brackets/dates
+
+"""
+    _PROMPT_FOOTER = """
+
+Respond ONLY with JSON:
+{"1": "meaningful", "2": "unmeaningful", ...}"""
+    
+    def __init__(self, portal_id: str, api_key: str, db: Optional['IsolatedDatabaseManager'] = None):
         self.portal_id = portal_id
         if not api_key or not MISTRAL_AVAILABLE:
             raise ValueError(f"[{portal_id}] Mistral API not available")
         
         self.client = Mistral(api_key=api_key)
         self.cache = {}  # ISOLATED CACHE
+        self.db = db
+    
+    @staticmethod
+    def title_hash(title: str) -> str:
+        """Key for a title in the persistent cache"""
+        return hashlib.md5(title.encode()).hexdigest()
         
     def check_titles(self, titles: List[str]) -> Dict[str, bool]:
         """Batch analyze titles with isolated cache"""
-        uncached = [t for t in titles if t not in self.cache]
+        # Each distinct title is looked up (and sent) once
+        uncached = list(dict.fromkeys(t for t in titles if t not in self.cache))
+        
+        if uncached and self.db is not None:
+            hashes = {t: self.title_hash(t) for t in uncached}
+            stored = self.db.get_ai_cache(list(hashes.values()))
+            for title, h in hashes.items():
+                if h in stored:
+                    self.cache[title] = stored[h]
+            uncached = [t for t in uncached if t not in self.cache]
         
         if not uncached:
             return {t: self.cache[t] for t in titles}
         
-        titles_list = "\n".join([f"{i+1}. {title}" for i, title in enumerate(uncached)])
+        # Chunks go out concurrently; the calls are network-bound
+        chunks = [uncached[i:i + self.BATCH_SIZE] for i in range(0, len(uncached), self.BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(chunks))) as executor:
+            futures = [executor.submit(self._check_chunk, chunk) for chunk in chunks]
         
-        prompt = f"""Analyze these tender titles. Classify as "meaningful" or "unmeaningful".
-
-MEANINGFUL: Has descriptive English words about the tender
-UNMEANINGFUL: Only codes/IDs/brackets/dates
-
-{titles_list}
-
-Respond ONLY with JSON:
-{{"1": "meaningful", "2": "unmeaningful", ...}}"""
-
-        try:
-            response = self.client.chat.complete(
-                model="mistral-large-latest",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0,
-                response_format={"type": "json_object"}
-            )
-            
-            content = response.choices[0].message.content.strip()
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
+        for chunk, future in zip(chunks, futures):
+            try:
+                verdicts = future.result()
+            except Exception:
+                # Fallbacks stay in memory only, so the next run asks the API again
+                self.cache.update({t: True for t in chunk})
+                continue
             
+            self.cache.update(verdicts)
+            if self.db is not None:
+                self.db.set_ai_cache({self.title_hash(t): v for t, v in verdicts.items()})
+        
+        return {t: self.cache[t] for t in titles}
+    
+    def _check_chunk(self, titles: List[str]) -> Dict[str, bool]:
+        """Classify one chunk of distinct titles in a single request, backing off on 429s"""
+        titles_list = "\n".join(f"{i}. {title}" for i, title in enumerate(titles, 1))
+        prompt = self._PROMPT_HEADER + titles_list + self._PROMPT_FOOTER
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                response = self.client.chat.complete(
+                    model="mistral-large-latest",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0,
+                    response_format={"type": "json_object"}
+                )
+                break
+            except Exception as e:
+                rate_limited = getattr(e, 'status_code', None) == 429 or '429' in str(e)
+                if not rate_limited or attempt == self.MAX_RETRIES:
+                    raise
+                time.sleep(2 ** attempt)
+        
+        # json_object mode normally returns bare JSON; only search for a fence otherwise
+        content = response.choices[0].message.content.strip()
+        if content.startswith('{'):
             results = json.loads(content)
-            
-            for i, title in enumerate(uncached, 1):
-                is_meaningful = results.get(str(i), "meaningful") == "meaningful"
-                self.cache[title] = is_meaningful
-            
-            return {t: self.cache[t] for t in titles}
-            
-        except Exception as e:
-            fallback = {t: True for t in uncached}
-            self.cache.update(fallback)
-            return {t: self.cache.get(t, True) for t in titles}
+        else:
+            match = _FENCE_RE.search(content)
+            if not match:
+                # Unusable reply: let check_titles fall back without caching it
+                raise ValueError(f"No JSON object in AI response: {content[:100]}")
+            results = json.loads(match.group(1))
+        
+        return {
+            title: results.get(str(i), "meaningful") == "meaningful"
+            for i, title in enumerate(titles, 1)
+        }
 
 # ======================= ISOLATED DATABASE MANAGER =======================
 
+# Per-connection tuning for the portal writers. journal_mode=WAL is set once
+# in _init_schema and persists in the database file; these do not.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Rows fetched per round trip when streaming an Excel mirror
+EXPORT_CHUNK_SIZE = 10_000
+
 class IsolatedDatabaseManager:
     """Database manager with portal-specific isolation and UPSERT logic"""
     
     def __init__(self, db_path: str, portal_id: str):
         self.db_path = db_path
         self.portal_id = portal_id
+        self._conn = None
+        self._lock = threading.Lock()
         self._init_schema()
     
     def _init_schema(self):
         """Initialize database schema with portal_id tagging"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Main tenders table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tenders (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                portal_id TEXT NOT NULL,
-                identity_hash TEXT NOT NULL,
-                portal_source TEXT,
-                s_no TEXT,
-                e_published_date TEXT,
-                closing_date TEXT,
-                opening_date TEXT,
-                title TEXT,
-                org_chain TEXT,
-                details_url TEXT,
-                work_description TEXT,
-                run_date TEXT,
-                phase1_status TEXT DEFAULT 'extracted',
-                phase2_status TEXT DEFAULT 'pending',
-                ai_filtered INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(portal_id, identity_hash)
-            )
-        """)
-        
-        # Metadata table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS scraping_metadata (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                portal_id TEXT NOT NULL,
-                key TEXT NOT NULL,
-                value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(portal_id, key)
-            )
-        """)
-        
-        # Failed URLs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS failed_urls (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                portal_id TEXT NOT NULL,
-                tender_id INTEGER,
-                details_url TEXT,
-                failure_reason TEXT,
-                retry_count INTEGER DEFAULT 0,
-                last_retry_at TIMESTAMP,
-                status TEXT DEFAULT 'failed',
-                FOREIGN KEY (tender_id) REFERENCES tenders(id)
-            )
-        """)
-        
-        # Portal execution log
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS portal_execution_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                portal_id TEXT NOT NULL,
-                execution_start TIMESTAMP,
-                execution_end TIMESTAMP,
-                status TEXT,
-                total_extracted INTEGER DEFAULT 0,
-                total_filtered INTEGER DEFAULT 0,
-                total_kept INTEGER DEFAULT 0,
-                phase2_success INTEGER DEFAULT 0,
-                phase2_failed INTEGER DEFAULT 0,
-                error_message TEXT,
-                pages_scraped INTEGER DEFAULT 0
-            )
-        """)
-        
-        # Indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_portal_hash ON tenders(portal_id, identity_hash)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_portal_phase2 ON tenders(portal_id, phase2_status)")
-        
-        conn.commit()
-        conn.close()
+        # WAL lets the analyzer's read-only connections run alongside the
+        # portal writers without blocking them (the mode persists in the file).
+        # journal_mode cannot change inside a transaction, so set it first.
+        with self._lock:
+            conn = self.get_connection()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+        
+        # One write transaction, so portals starting together don't interleave DDL
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+            
+            existing_indexes = {row[0] for row in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )}
+            
+            # Main tenders table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tenders (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    portal_id TEXT NOT NULL,
+                    identity_hash TEXT NOT NULL,
+                    portal_source TEXT,
+                    s_no TEXT,
+                    e_published_date TEXT,
+                    closing_date TEXT,
+                    opening_date TEXT,
+                    title TEXT,
+                    org_chain TEXT,
+                    details_url TEXT,
+                    work_description TEXT,
+                    run_date TEXT,
+                    phase1_status TEXT DEFAULT 'extracted',
+                    phase2_status TEXT DEFAULT 'pending',
+                    ai_filtered INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    s_no_int INTEGER GENERATED ALWAYS AS (CAST(s_no AS INTEGER)) VIRTUAL,
+                    UNIQUE(portal_id, identity_hash)
+                )
+            """)
+            
+            # Databases created before s_no_int existed get it added in place
+            # (table_xinfo, unlike table_info, lists generated columns)
+            columns = {row[1] for row in cursor.execute("PRAGMA table_xinfo(tenders)")}
+            if 's_no_int' not in columns:
+                cursor.execute("""
+                    ALTER TABLE tenders ADD COLUMN
+                    s_no_int INTEGER GENERATED ALWAYS AS (CAST(s_no AS INTEGER)) VIRTUAL
+                """)
+            
+            # Metadata table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scraping_metadata (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    portal_id TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(portal_id, key)
+                )
+            """)
+            
+            # Failed URLs table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS failed_urls (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    portal_id TEXT NOT NULL,
+                    tender_id INTEGER,
+                    details_url TEXT,
+                    failure_reason TEXT,
+                    retry_count INTEGER DEFAULT 0,
+                    last_retry_at TIMESTAMP,
+                    status TEXT DEFAULT 'failed',
+                    FOREIGN KEY (tender_id) REFERENCES tenders(id)
+                )
+            """)
+            
+            # Persistent AI verdicts per portal, keyed by title hash
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ai_title_cache (
+                    portal_id TEXT NOT NULL,
+                    title_hash TEXT NOT NULL,
+                    is_meaningful INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (portal_id, title_hash)
+                )
+            """)
+            
+            # Portal execution log
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS portal_execution_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    portal_id TEXT NOT NULL,
+                    execution_start TIMESTAMP,
+                    execution_end TIMESTAMP,
+                    status TEXT,
+                    total_extracted INTEGER DEFAULT 0,
+                    total_filtered INTEGER DEFAULT 0,
+                    total_kept INTEGER DEFAULT 0,
+                    phase2_success INTEGER DEFAULT 0,
+                    phase2_failed INTEGER DEFAULT 0,
+                    error_message TEXT,
+                    pages_scraped INTEGER DEFAULT 0
+                )
+            """)
+            
+            # After the tables, since merged tenders repoint their failed_urls rows
+            if cursor.execute("PRAGMA user_version").fetchone()[0] < 1:
+                self._migrate_identity_hashes(cursor)
+                cursor.execute("PRAGMA user_version = 1")
+            
+            # Indexes
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_portal_hash ON tenders(portal_id, identity_hash)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_portal_phase2 ON tenders(portal_id, phase2_status)")
+            
+            # Phase 2 queue (get_tenders_for_phase2)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_portal_phase2_filt
+                ON tenders(portal_id, phase2_status, ai_filtered) WHERE details_url != ''
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tenders_sort
+                ON tenders(portal_id, s_no_int) WHERE ai_filtered = 1
+            """)
+            
+            # Indexes for the reporting queries in data_aggregation.py
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tenders_portal_filtered
+                ON tenders(portal_id, portal_source, ai_filtered, phase2_status)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tenders_kept_closing
+                ON tenders(closing_date) WHERE ai_filtered = 1 AND phase2_status = 'success'
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_failed_urls_portal_status ON failed_urls(portal_id, status)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_exec_log_start ON portal_execution_log(execution_start DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_exec_log_portal_id ON portal_execution_log(portal_id, id DESC)")
+            
+            # Keyword search uses '%kw%' patterns, which no index can serve; drop the
+            # NOCASE indexes older databases carry so Phase 2 updates stop maintaining them
+            cursor.execute("DROP INDEX IF EXISTS idx_tenders_title_nocase")
+            cursor.execute("DROP INDEX IF EXISTS idx_tenders_work_desc_nocase")
+            
+            # Refresh planner statistics only when new indexes were created
+            current_indexes = {row[0] for row in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )}
+            if current_indexes - existing_indexes:
+                cursor.execute("ANALYZE")
+    
+    def _migrate_identity_hashes(self, cursor: sqlite3.Cursor):
+        """
+        user_version 1: identity hashes moved from md5 to blake2b, and clean_text
+        began collapsing whole whitespace runs. Re-clean the stored listing fields
+        as clean_text now would and rehash them, so existing tenders keep matching
+        on the next UPSERT instead of being re-inserted. Rows that become identical
+        are merged, keeping the one that already has its work description;
+        failed_urls rows of the dropped ones are repointed at it.
+        """
+        rows = cursor.execute("""
+            SELECT id, portal_id, s_no, e_published_date, closing_date, opening_date, title, org_chain
+            FROM tenders
+            ORDER BY phase2_status = 'success' DESC, id
+        """).fetchall()
+        
+        kept_ids = {}  # (portal_id, identity_hash) -> id of the row that stays
+        updates, duplicates = [], []
+        for tender_id, portal_id, s_no, e_published, closing, opening, title, org_chain in rows:
+            # Titles are "<title>\n<ref no>" with each part cleaned on its own
+            title = "\n".join(clean_cell(part) for part in (title or "").split("\n"))
+            e_published, org_chain = clean_cell(e_published), clean_cell(org_chain)
+            identity_hash = tender_identity_hash(title, e_published, org_chain)
+            
+            kept_id = kept_ids.get((portal_id, identity_hash))
+            if kept_id is not None:
+                duplicates.append((kept_id, tender_id))
+                continue
+            kept_ids[(portal_id, identity_hash)] = tender_id
+            updates.append((identity_hash, clean_cell(s_no), e_published, clean_cell(closing),
+                            clean_cell(opening), title, org_chain, tender_id))
+        
+        # Failed URLs of a merged row move to the row that stays, so tender_id never dangles
+        cursor.executemany("UPDATE failed_urls SET tender_id = ? WHERE tender_id = ?", duplicates)
+        cursor.executemany("DELETE FROM tenders WHERE id = ?", [(tender_id,) for _, tender_id in duplicates])
+        cursor.executemany("""
+            UPDATE tenders SET
+                identity_hash = ?, s_no = ?, e_published_date = ?, closing_date = ?,
+                opening_date = ?, title = ?, org_chain = ?
+            WHERE id = ?
+        """, updates)
     
     def get_connection(self):
-        """Get thread-safe connection"""
-        return sqlite3.connect(self.db_path, check_same_thread=False)
+        """
+        Get the cached connection (autocommit mode), opening it on first use.
+        Single statements commit on their own (one WAL append, no fsync with
+        synchronous=NORMAL); multi-statement writes go through _transaction().
+        Callers must hold self._lock while using it.
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            for pragma in CONNECTION_PRAGMAS:
+                self._conn.execute(pragma)
+        return self._conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and run the block in BEGIN IMMEDIATE ... COMMIT (ROLLBACK on error)"""
+        with self._lock:
+            conn = self.get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+    
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        """Run one statement on the shared connection and return its rows"""
+        with self._lock:
+            return self.get_connection().execute(sql, params).fetchall()
+    
+    def close(self):
+        """Close the cached connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
     
     def set_metadata(self, key: str, value: str):
         """Set portal-specific metadata"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
+        self._execute("""
             INSERT OR REPLACE INTO scraping_metadata (portal_id, key, value, updated_at)
             VALUES (?, ?, ?, CURRENT_TIMESTAMP)
         """, (self.portal_id, key, value))
-        conn.commit()
-        conn.close()
     
     def get_metadata(self, key: str) -> Optional[str]:
         """Get portal-specific metadata"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
+        rows = self._execute("""
             SELECT value FROM scraping_metadata 
             WHERE portal_id = ? AND key = ?
         """, (self.portal_id, key))
-        result = cursor.fetchone()
-        conn.close()
-        return result[0] if result else None
+        return rows[0][0] if rows else None
     
     def upsert_tenders_batch(self, tenders: List[dict]) -> tuple:
         """
         UPSERT multiple tenders - insert new, update existing.
         Returns (inserted, updated) counts.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        inserted = 0
-        updated = 0
+        if not tenders:
+            return (0, 0)
         
-        try:
-            for tender in tenders:
-                # Check if tender exists
-                cursor.execute("""
-                    SELECT id FROM tenders 
-                    WHERE portal_id = ? AND identity_hash = ?
-                """, (self.portal_id, tender['Identity Hash']))
-                
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # UPDATE existing tender
-                    cursor.execute("""
-                        UPDATE tenders SET
-                            portal_source = ?,
-                            s_no = ?,
-                            e_published_date = ?,
-                            closing_date = ?,
-                            opening_date = ?,
-                            title = ?,
-                            org_chain = ?,
-                            details_url = ?,
-                            run_date = ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE portal_id = ? AND identity_hash = ?
-                    """, (
-                        tender['Portal Source'],
-                        tender['S.No.'],
-                        tender['e-Published Date'],
-                        tender['Bid Submission Closing Date'],
-                        tender['Tender Opening Date'],
-                        tender['Title and Ref.No./Tender ID'],
-                        tender['Organisation Chain'],
-                        tender['Details URL'],
-                        tender['Run Date'],
-                        self.portal_id,
-                        tender['Identity Hash']
-                    ))
-                    if cursor.rowcount > 0:
-                        updated += 1
-                else:
-                    # INSERT new tender
-                    cursor.execute("""
-                        INSERT INTO tenders (
-                            portal_id, identity_hash, portal_source, s_no, 
-                            e_published_date, closing_date, opening_date, 
-                            title, org_chain, details_url, work_description, 
-                            run_date, phase1_status, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    """, (
-                        self.portal_id,
-                        tender['Identity Hash'],
-                        tender['Portal Source'],
-                        tender['S.No.'],
-                        tender['e-Published Date'],
-                        tender['Bid Submission Closing Date'],
-                        tender['Tender Opening Date'],
-                        tender['Title and Ref.No./Tender ID'],
-                        tender['Organisation Chain'],
-                        tender['Details URL'],
-                        tender.get('Work Description', ''),
-                        tender['Run Date'],
-                        'extracted'
-                    ))
-                    if cursor.rowcount > 0:
-                        inserted += 1
+        rows = [(
+            self.portal_id,
+            tender['Identity Hash'],
+            tender['Portal Source'],
+            tender['S.No.'],
+            tender['e-Published Date'],
+            tender['Bid Submission Closing Date'],
+            tender['Tender Opening Date'],
+            tender['Title and Ref.No./Tender ID'],
+            tender['Organisation Chain'],
+            tender['Details URL'],
+            tender.get('Work Description', ''),
+            tender['Run Date'],
+            'extracted'
+        ) for tender in tenders]
+        hashes = list({row[1] for row in rows})
+        
+        with self._transaction() as conn:
+            cursor = conn.cursor()
             
-            conn.commit()
-            return (inserted, updated)
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+            # One lookup for the whole batch, only to report inserted vs updated
+            cursor.execute(
+                "SELECT identity_hash FROM tenders WHERE portal_id = ? AND identity_hash IN (%s)"
+                % ",".join("?" * len(hashes)),
+                (self.portal_id, *hashes)
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            
+            # Existing rows keep their work description and phase statuses
+            cursor.executemany("""
+                INSERT INTO tenders (
+                    portal_id, identity_hash, portal_source, s_no, 
+                    e_published_date, closing_date, opening_date, 
+                    title, org_chain, details_url, work_description, 
+                    run_date, phase1_status, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(portal_id, identity_hash) DO UPDATE SET
+                    portal_source = excluded.portal_source,
+                    s_no = excluded.s_no,
+                    e_published_date = excluded.e_published_date,
+                    closing_date = excluded.closing_date,
+                    opening_date = excluded.opening_date,
+                    title = excluded.title,
+                    org_chain = excluded.org_chain,
+                    details_url = excluded.details_url,
+                    run_date = excluded.run_date,
+                    updated_at = CURRENT_TIMESTAMP
+            """, rows)
+        
+        # Repeats within the batch count as updates, as the row-by-row version did
+        inserted = len(hashes) - len(existing)
+        return (inserted, len(rows) - inserted)
     
     def update_work_description(self, identity_hash: str, work_desc: str, status: str = 'success'):
         """Update work description for a tender"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
+        self._execute("""
             UPDATE tenders 
             SET work_description = ?, phase2_status = ?, updated_at = CURRENT_TIMESTAMP
             WHERE portal_id = ? AND identity_hash = ?
         """, (work_desc, status, self.portal_id, identity_hash))
-        conn.commit()
-        conn.close()
     
     def mark_ai_filtered(self, identity_hash: str, keep: bool):
         """Mark tender as AI filtered"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
+        self._execute("""
             UPDATE tenders 
             SET ai_filtered = ?, updated_at = CURRENT_TIMESTAMP
             WHERE portal_id = ? AND identity_hash = ?
         """, (1 if keep else -1, self.portal_id, identity_hash))
-        conn.commit()
-        conn.close()
+    
+    def update_work_descriptions_batch(self, rows: List[tuple]):
+        """Update work descriptions in one transaction; rows are (identity_hash, work_desc, status)"""
+        with self._transaction() as conn:
+            conn.executemany("""
+                UPDATE tenders 
+                SET work_description = ?, phase2_status = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE portal_id = ? AND identity_hash = ?
+            """, [(work_desc, status, self.portal_id, h) for h, work_desc, status in rows])
+    
+    def mark_ai_filtered_batch(self, rows: List[tuple]):
+        """Mark tenders as AI filtered in one transaction; rows are (identity_hash, keep)"""
+        with self._transaction() as conn:
+            conn.executemany("""
+                UPDATE tenders 
+                SET ai_filtered = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE portal_id = ? AND identity_hash = ?
+            """, [(1 if keep else -1, self.portal_id, h) for h, keep in rows])
+    
+    def get_ai_cache(self, title_hashes: List[str]) -> Dict[str, bool]:
+        """Get stored AI verdicts for the given title hashes"""
+        if not title_hashes:
+            return {}
+        rows = self._execute(
+            "SELECT title_hash, is_meaningful FROM ai_title_cache WHERE portal_id = ? AND title_hash IN (%s)"
+            % ",".join("?" * len(title_hashes)),
+            (self.portal_id, *title_hashes)
+        )
+        return {h: bool(v) for h, v in rows}
+    
+    def set_ai_cache(self, verdicts: Dict[str, bool]):
+        """Store AI verdicts keyed by title hash"""
+        with self._transaction() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO ai_title_cache (portal_id, title_hash, is_meaningful)
+                VALUES (?, ?, ?)
+            """, [(self.portal_id, h, int(v)) for h, v in verdicts.items()])
     
     def get_phase1_count(self) -> int:
         """Get count of Phase 1 extracted tenders"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM tenders WHERE portal_id = ? AND phase1_status = 'extracted'", 
-                      (self.portal_id,))
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
-    
-    def get_tenders_for_ai_filtering(self) -> List[dict]:
-        """Get unfiltered tenders for this portal"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT identity_hash, title FROM tenders 
-            WHERE portal_id = ? AND ai_filtered = 0
-        """, (self.portal_id,))
-        rows = cursor.fetchall()
-        conn.close()
-        return [{'hash': r[0], 'title': r[1]} for r in rows]
+        rows = self._execute("SELECT COUNT(*) FROM tenders WHERE portal_id = ? AND phase1_status = 'extracted'", 
+                             (self.portal_id,))
+        return rows[0][0]
+    
+    def iter_tenders_for_ai_filtering(self, batch_size: int = 50) -> Iterator[List[dict]]:
+        """
+        Yield unfiltered tenders for this portal in batches of up to batch_size.
+        Pages by id (keyset), so only one batch is in memory at a time.
+        """
+        last_id = 0
+        while True:
+            rows = self._execute("""
+                SELECT id, identity_hash, title FROM tenders 
+                WHERE portal_id = ? AND ai_filtered = 0 AND id > ?
+                ORDER BY id
+                LIMIT ?
+            """, (self.portal_id, last_id, batch_size))
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [{'hash': r[1], 'title': r[2]} for r in rows]
     
     def get_tenders_for_phase2(self) -> List[dict]:
         """Get tenders needing work descriptions for this portal"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
+        rows = self._execute("""
             SELECT id, identity_hash, details_url, s_no
             FROM tenders 
             WHERE portal_id = ? 
-            AND (ai_filtered = 1 OR ai_filtered = 0) 
+            AND ai_filtered >= 0
             AND phase2_status IN ('pending', 'failed')
             AND details_url != ''
         """, (self.portal_id,))
-        rows = cursor.fetchall()
-        conn.close()
         return [{'id': r[0], 'hash': r[1], 'url': r[2], 's_no': r[3]} for r in rows]
     
     def add_failed_url(self, tender_id: int, url: str, reason: str):
         """Track failed URL"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
+        self._execute("""
             INSERT INTO failed_urls (portal_id, tender_id, details_url, failure_reason, last_retry_at)
             VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
         """, (self.portal_id, tender_id, url, reason))
-        conn.commit()
-        conn.close()
+    
+    def add_failed_urls_batch(self, rows: List[tuple]):
+        """Track failed URLs in one transaction; rows are (tender_id, url, reason)"""
+        with self._transaction() as conn:
+            conn.executemany("""
+                INSERT INTO failed_urls (portal_id, tender_id, details_url, failure_reason, last_retry_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, [(self.portal_id, tender_id, url, reason) for tender_id, url, reason in rows])
     
     def export_to_excel(self, filepath: str, filter_kept_only: bool = False):
-        """Export portal data to Excel"""
-        conn = self.get_connection()
-        
+        """
+        Export portal data to Excel.
+        Streams rows from the cursor into a write-only workbook, so memory stays
+        flat however many tenders the portal has.
+        """
         query = """
             SELECT 
                 portal_id as 'Portal ID',
@@ -458,33 +708,38 @@ class IsolatedDatabaseManager:
         
         query += " ORDER BY id"
         
-        df = pd.read_sql_query(query, conn, params=(self.portal_id,))
-        conn.close()
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet('Sheet1')
+        rows_written = 0
+        
+        with self._lock:
+            cursor = self.get_connection().execute(query, (self.portal_id,))
+            ws.append([c[0] for c in cursor.description])
+            while True:
+                rows = cursor.fetchmany(EXPORT_CHUNK_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    ws.append(row)
+                rows_written += len(rows)
         
-        df.to_excel(filepath, index=False, engine='openpyxl')
-        return len(df)
+        wb.save(filepath)
+        return rows_written
     
     def get_statistics(self) -> dict:
         """Get statistics for this portal"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM tenders WHERE portal_id = ?", (self.portal_id,))
-        total = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM tenders WHERE portal_id = ? AND ai_filtered = 1", (self.portal_id,))
-        kept = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM tenders WHERE portal_id = ? AND ai_filtered = -1", (self.portal_id,))
-        filtered = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM tenders WHERE portal_id = ? AND phase2_status = 'success'", (self.portal_id,))
-        phase2_success = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM tenders WHERE portal_id = ? AND phase2_status = 'failed'", (self.portal_id,))
-        phase2_failed = cursor.fetchone()[0]
-        
-        conn.close()
+        # One pass over the portal's rows (covered by idx_tenders_portal_filtered)
+        rows = self._execute("""
+            SELECT 
+                COUNT(*),
+                COUNT(*) FILTER (WHERE ai_filtered = 1),
+                COUNT(*) FILTER (WHERE ai_filtered = -1),
+                COUNT(*) FILTER (WHERE phase2_status = 'success'),
+                COUNT(*) FILTER (WHERE phase2_status = 'failed')
+            FROM tenders
+            WHERE portal_id = ?
+        """, (self.portal_id,))
+        total, kept, filtered, phase2_success, phase2_failed = rows[0]
         
         return {
             'portal_id': self.portal_id,
@@ -498,9 +753,7 @@ class IsolatedDatabaseManager:
     def log_execution(self, start_time: datetime, end_time: datetime, 
                      status: str, stats: dict, pages_scraped: int, error_msg: Optional[str] = None):
         """Log portal execution with page count"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
+        self._execute("""
             INSERT INTO portal_execution_log (
                 portal_id, execution_start, execution_end, status,
                 total_extracted, total_filtered, total_kept,
@@ -519,8 +772,6 @@ class IsolatedDatabaseManager:
             pages_scraped,
             error_msg
         ))
-        conn.commit()
-        conn.close()
 
 # File continues...
 
@@ -532,6 +783,76 @@ class IsolatedPortalScraper:
     Complete isolation for each portal instance.
     """
     
+    # Reads every tender row of the listing page in one browser round trip:
+    # [s_no, e_published, closing, opening, link_text, href, title_cell_text, org_chain]
+    # (link_text / href are null when the title cell has no link)
+    _EXTRACT_ROWS_JS = """
+        () => Array.from(document.querySelectorAll('tr.even, tr.odd'))
+            .map(row => row.querySelectorAll('td'))
+            .filter(cells => cells.length >= 6)
+            .map(cells => {
+                const link = cells[4].querySelector('a');
+                return [
+                    cells[0].innerText, cells[1].innerText, cells[2].innerText, cells[3].innerText,
+                    link ? link.innerText : null, link ? link.getAttribute('href') : null,
+                    cells[4].innerText, cells[5].innerText
+                ];
+            })
+    """
+    
+    # All Next-link checks in one round trip; returns '' when the link is usable,
+    # otherwise the reason pagination should stop
+    _NEXT_LINK_STATE_JS = """
+        () => {
+            const link = document.querySelector('a#linkFwd');
+            if (!link) return {reason: 'next_link_not_found', href: null};
+            const style = getComputedStyle(link);
+            if (!link.getClientRects().length || style.visibility === 'hidden') {
+                return {reason: 'next_link_hidden', href: null};
+            }
+            if (link.className.toLowerCase().includes('disabled') || link.hasAttribute('disabled')
+                || link.getAttribute('aria-disabled') === 'true') {
+                return {reason: 'next_link_disabled', href: null};
+            }
+            const href = link.getAttribute('href');
+            if (!href || href === '#' || href === 'javascript:void(0)') {
+                return {reason: 'next_link_invalid_href', href: null};
+            }
+            return {reason: '', href: href};
+        }
+    """
+    
+    # Present once a listing page has rendered (tender rows, or the Next link)
+    _LISTING_READY_SELECTOR = "tr.even, tr.odd, a#linkFwd"
+    
+    # Rows and Next-link state together, so a listing page costs one round trip
+    _LISTING_PAGE_JS = f"() => ({{rows: ({_EXTRACT_ROWS_JS})(), next: ({_NEXT_LINK_STATE_JS})()}})"
+    
+    # Log line for each end-of-data reason returned by _NEXT_LINK_STATE_JS
+    _NEXT_LINK_END_MESSAGES = {
+        'next_link_not_found': "Next link not found (a#linkFwd) - END OF DATA",
+        'next_link_hidden': "Next link exists but not visible - END OF DATA",
+        'next_link_disabled': "Next link is disabled - END OF DATA",
+        'next_link_invalid_href': "Next link has invalid href - END OF DATA",
+    }
+    
+    # Phase 2 fallback: text of the cell next to the 'Work Description' caption, or null
+    _WORK_DESC_FALLBACK_JS = """
+        () => {
+            for (const tr of document.querySelectorAll('tbody tr')) {
+                const cells = tr.querySelectorAll('td');
+                if (cells.length >= 2 && cells[0].innerText.includes('Work Description')) {
+                    return cells[1].innerText;
+                }
+            }
+            return null;
+        }
+    """
+    
+    # Request types aborted by the shared context's route handler. Stylesheets
+    # still load: the Next-link check relies on computed visibility.
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+    
     def __init__(self, config: PortalConfig, db_path: str, api_key: str):
         self.config = config
         self.portal_id = config.portal_id
@@ -540,26 +861,97 @@ class IsolatedPortalScraper:
         self.db = IsolatedDatabaseManager(db_path, config.portal_id)
         self.ai_checker = None
         if api_key and MISTRAL_AVAILABLE:
-            self.ai_checker = IsolatedAIChecker(config.portal_id, api_key)
+            self.ai_checker = IsolatedAIChecker(config.portal_id, api_key, db=self.db)
         
-        # Isolated logger
+        # Isolated logger (records are written by a background listener)
+        self._log_listener = None
         self.logger = self._setup_logger()
         
         # Session configuration
         self.page_load_timeout = 45000
         self.pagination_delay = 1.0  # Increased for production stability
-        self.phase2_delay = 2
+        self.phase2_concurrency = 8  # detail pages fetched in parallel
+        self.phase2_flush_every = 200  # results buffered per DB transaction
         self.session_refresh_every = 10
+        self.session_breaker_threshold = 5  # consecutive session errors before an early refresh
+        
+        # Mid-run Excel mirrors rewrite the whole workbook, so they are rate limited
+        self.export_interval_seconds = 300
+        self._last_export = 0.0
         
         # Stale element retry configuration
         self.max_stale_retries = 3
-        self.stale_retry_delay = 2
         
-        # Page tracking
+        # Retry backoff: base * 2**(attempt-1) seconds, capped, plus jitter
+        self.retry_backoff_base = 0.5
+        self.retry_backoff_cap = 8.0
+        self.retry_backoff_jitter = 0.25
+        
+        # Page tracking; the resume point is persisted every metadata_flush_every pages
         self.pages_scraped = 0
+        self.metadata_flush_every = 5
+        self._last_stored_page = 0
+        self._last_meta_flush_page = 0
+        self._phase1_total = 0
+        
+        # Playwright state, started on first use and shared by every phase
+        self._pw = None
+        self._browser = None
+        self._context = None
+    
+    def get_context(self) -> BrowserContext:
+        """
+        Get the shared browser context, launching Chromium on first use.
+        Images, fonts and media are never downloaded; only the page markup is scraped.
+        """
+        if self._context is None:
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(headless=False)
+            self._context = self._browser.new_context(ignore_https_errors=True)
+            self._context.route("**/*", self._route_request)
+        return self._context
+    
+    def _route_request(self, route):
+        """Abort blocked resource types, let everything else through"""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def get_page(self) -> Page:
+        """Open a fresh page on the shared context; callers close it when done"""
+        page = self.get_context().new_page()
+        page.set_default_timeout(self.page_load_timeout)
+        return page
+    
+    def close_browser(self):
+        """Shut down the shared context, browser and Playwright driver"""
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+    
+    def close(self):
+        """Release the browser and the database connection, then flush the log"""
+        self.close_browser()
+        self.db.close()
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            for handler in self._log_listener.handlers:
+                handler.close()
+            self._log_listener = None
     
     def _setup_logger(self) -> logging.Logger:
-        """Setup isolated logger for this portal"""
+        """
+        Setup isolated logger for this portal.
+        The logger only enqueues records; a QueueListener thread formats them and
+        does the file/console writes, keeping disk I/O off the scraping thread.
+        """
         logger = logging.getLogger(f"Portal_{self.portal_id}")
         logger.setLevel(logging.INFO)
         logger.handlers = []
@@ -573,21 +965,29 @@ class IsolatedPortalScraper:
         fh.setFormatter(formatter)
         ch.setFormatter(formatter)
         
-        logger.addHandler(fh)
-        logger.addHandler(ch)
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._log_listener = logging.handlers.QueueListener(log_queue, fh, ch, respect_handler_level=True)
+        self._log_listener.start()
         
         return logger
     
     def clean_text(self, text: str) -> str:
         """Clean extracted text"""
-        if not text:
-            return ""
-        return text.strip().replace('\n', ' ').replace('\t', ' ').replace('  ', ' ')
+        return clean_cell(text)
     
     def create_identity_hash(self, tender_data: dict) -> str:
         """Create unique hash for deduplication"""
-        key = f"{tender_data.get('Title and Ref.No./Tender ID', '')}_{tender_data.get('e-Published Date', '')}_{tender_data.get('Organisation Chain', '')}"
-        return hashlib.md5(key.encode()).hexdigest()
+        return tender_identity_hash(
+            tender_data.get('Title and Ref.No./Tender ID', ''),
+            tender_data.get('e-Published Date', ''),
+            tender_data.get('Organisation Chain', '')
+        )
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (1-based)"""
+        delay = min(self.retry_backoff_cap, self.retry_backoff_base * 2 ** (attempt - 1))
+        return delay + random.uniform(0, self.retry_backoff_jitter)
     
     def handle_pre_condition(self, page: Page) -> bool:
         """Handle portal-specific pre-conditions (e.g., NTPC alert dialog)"""
@@ -644,117 +1044,105 @@ class IsolatedPortalScraper:
             self.logger.error(f"Navigation error: {e}")
             return False
     
+    def scrape_listing_page(self, page: Page, page_num: int) -> tuple:
+        """
+        Extract tenders and the Next link from the current page in one evaluate.
+        Returns (tenders, next_url); next_url is None at the end of data.
+        Falls back to the separate extraction and stale-retrying Next check on error.
+        """
+        try:
+            state = page.evaluate(self._LISTING_PAGE_JS)
+        except Exception as e:
+            self.logger.warning(f"Listing evaluate failed, checking separately: {e}")
+            return (self.extract_tenders_from_page(page), self.get_next_page_link_with_retry(page, page_num))
+        
+        tenders = self._parse_listing_rows(state['rows'])
+        
+        reason, href = state['next']['reason'], state['next']['href']
+        if reason:
+            self.logger.info(self._NEXT_LINK_END_MESSAGES[reason])
+            self.logger.info(f"No more pages available: {reason}")
+            return (tenders, None)
+        
+        next_url = f"{self.config.base_url}{href}" if href.startswith("/") else href
+        return (tenders, next_url)
+    
     def extract_tenders_from_page(self, page: Page) -> List[dict]:
         """Extract tenders from current page"""
-        tenders = []
         try:
-            rows = page.query_selector_all("tr.even, tr.odd")
-            
-            for row in rows:
-                try:
-                    cells = row.query_selector_all("td")
-                    if len(cells) < 6:
-                        continue
-                    
-                    s_no = self.clean_text(cells[0].inner_text())
-                    e_published = self.clean_text(cells[1].inner_text())
-                    closing_date = self.clean_text(cells[2].inner_text())
-                    opening_date = self.clean_text(cells[3].inner_text())
-                    
-                    title_cell = cells[4]
-                    link_elem = title_cell.query_selector("a")
-                    if link_elem:
-                        title_text = self.clean_text(link_elem.inner_text())
-                        href = link_elem.get_attribute("href")
-                        details_url = f"{self.config.base_url}{href}" if href and href.startswith("/") else (href or "")
-                    else:
-                        title_text = self.clean_text(title_cell.inner_text())
-                        details_url = ""
-                    
-                    ref_texts = title_cell.inner_text().split('\n')
-                    ref_no = self.clean_text(ref_texts[1]) if len(ref_texts) > 1 else ""
-                    full_title = f"{title_text}\n{ref_no}" if ref_no else title_text
-                    
-                    org_chain = self.clean_text(cells[5].inner_text())
-                    
-                    tender_data = {
-                        "Portal Source": self.config.name,
-                        "S.No.": s_no,
-                        "e-Published Date": e_published,
-                        "Bid Submission Closing Date": closing_date,
-                        "Tender Opening Date": opening_date,
-                        "Title and Ref.No./Tender ID": full_title,
-                        "Organisation Chain": org_chain,
-                        "Details URL": details_url,
-                        "Work Description": "",
-                        "Run Date": datetime.now().strftime("%Y-%m-%d")
-                    }
-                    
-                    tender_data["Identity Hash"] = self.create_identity_hash(tender_data)
-                    tenders.append(tender_data)
-                    
-                except Exception as row_error:
-                    self.logger.warning(f"Row extraction error: {row_error}")
-                    continue
-            
-            return tenders
+            return self._parse_listing_rows(page.evaluate(self._EXTRACT_ROWS_JS))
         except Exception as e:
             self.logger.error(f"Page extraction error: {e}")
             return []
     
+    def _parse_listing_rows(self, rows: List[list]) -> List[dict]:
+        """Build tender dicts from the raw cell texts returned by _EXTRACT_ROWS_JS"""
+        tenders = []
+        run_date = datetime.now().strftime("%Y-%m-%d")
+        for s_no, e_published, closing_date, opening_date, link_text, href, title_cell_text, org_chain in rows:
+            try:
+                if link_text is not None:
+                    title_text = self.clean_text(link_text)
+                    details_url = f"{self.config.base_url}{href}" if href and href.startswith("/") else (href or "")
+                else:
+                    title_text = self.clean_text(title_cell_text)
+                    details_url = ""
+                
+                ref_texts = title_cell_text.split('\n')
+                ref_no = self.clean_text(ref_texts[1]) if len(ref_texts) > 1 else ""
+                full_title = f"{title_text}\n{ref_no}" if ref_no else title_text
+                
+                tender_data = {
+                    "Portal Source": self.config.name,
+                    "S.No.": self.clean_text(s_no),
+                    "e-Published Date": self.clean_text(e_published),
+                    "Bid Submission Closing Date": self.clean_text(closing_date),
+                    "Tender Opening Date": self.clean_text(opening_date),
+                    "Title and Ref.No./Tender ID": full_title,
+                    "Organisation Chain": self.clean_text(org_chain),
+                    "Details URL": details_url,
+                    "Work Description": "",
+                    "Run Date": run_date
+                }
+                
+                tender_data["Identity Hash"] = self.create_identity_hash(tender_data)
+                tenders.append(tender_data)
+                
+            except Exception as row_error:
+                self.logger.warning(f"Row extraction error: {row_error}")
+                continue
+        
+        return tenders
+    
     def is_next_button_available(self, page: Page) -> tuple:
         """
         Check if Next button is available and clickable.
-        Returns (available: bool, reason: str)
+        Returns (available: bool, reason: str, href: Optional[str])
         
         CRITICAL: Dynamic end-of-data detection
         - Checks existence, visibility, and disabled state
         - Returns False if Next link is missing, hidden, or disabled
+        - Stale/detached errors are raised so the caller can retry
         """
         try:
             # Wait a moment for page to stabilize
             time.sleep(self.pagination_delay)
             
-            # Primary selector: a#linkFwd
-            next_link = page.query_selector("a#linkFwd")
-            
-            if not next_link:
-                self.logger.info("Next link not found (a#linkFwd) - END OF DATA")
-                return (False, "next_link_not_found")
-            
-            # Check if visible
-            if not next_link.is_visible():
-                self.logger.info("Next link exists but not visible - END OF DATA")
-                return (False, "next_link_hidden")
-            
-            # Check if disabled (CSS class or attribute)
-            classes = next_link.get_attribute('class') or ''
-            disabled_attr = next_link.get_attribute('disabled')
-            
-            if 'disabled' in classes.lower() or disabled_attr is not None:
-                self.logger.info("Next link is disabled - END OF DATA")
-                return (False, "next_link_disabled")
-            
-            # Check if link is actually clickable (enabled)
-            try:
-                if not next_link.is_enabled():
-                    self.logger.info("Next link is not enabled - END OF DATA")
-                    return (False, "next_link_not_enabled")
-            except:
-                pass
-            
-            # Check href is valid
-            href = next_link.get_attribute("href")
-            if not href or href == "#" or href == "javascript:void(0)":
-                self.logger.info("Next link has invalid href - END OF DATA")
-                return (False, "next_link_invalid_href")
+            # Existence, visibility, disabled state and href in one evaluate
+            state = page.evaluate(self._NEXT_LINK_STATE_JS)
+            reason = state['reason']
+            if reason:
+                self.logger.info(self._NEXT_LINK_END_MESSAGES[reason])
+                return (False, reason, None)
             
             # All checks passed - next button is available
-            return (True, "available")
+            return (True, "available", state['href'])
             
         except Exception as e:
+            if _STALE_RE.search(str(e)):
+                raise
             self.logger.error(f"Error checking next button: {e}")
-            return (False, f"check_error: {str(e)}")
+            return (False, f"check_error: {str(e)}", None)
     
     def get_next_page_link_with_retry(self, page: Page, page_num: int) -> Optional[str]:
         """
@@ -765,35 +1153,24 @@ class IsolatedPortalScraper:
         """
         for attempt in range(1, self.max_stale_retries + 1):
             try:
-                # Check if next button is available first
-                available, reason = self.is_next_button_available(page)
+                # Availability and href come back from the same evaluate
+                available, reason, href = self.is_next_button_available(page)
                 
                 if not available:
                     if attempt == 1:  # Only log on first attempt
                         self.logger.info(f"No more pages available: {reason}")
                     return None
                 
-                # Get the next link
-                next_link = page.query_selector("a#linkFwd")
-                if not next_link:
-                    return None
-                
-                href = next_link.get_attribute("href")
-                if not href:
-                    return None
-                
                 next_url = f"{self.config.base_url}{href}" if href.startswith("/") else href
                 return next_url
                 
             except Exception as e:
-                error_msg = str(e).lower()
-                
                 # Check if it's a stale element error
-                if 'stale' in error_msg or 'detached' in error_msg:
+                if _STALE_RE.search(str(e)):
                     self.logger.warning(f"Stale element on attempt {attempt}/{self.max_stale_retries}")
                     
                     if attempt < self.max_stale_retries:
-                        time.sleep(self.stale_retry_delay)
+                        time.sleep(self._backoff_delay(attempt))
                         self.logger.info(f"Retrying after stale element...")
                         continue
                     else:
@@ -824,63 +1201,81 @@ class IsolatedPortalScraper:
             # TODO: Navigate to resume point
         
         page_num = start_page
-        total_extracted = self.db.get_phase1_count()
+        # Running total, advanced by each page's insert count on the writer thread
+        self._phase1_total = total_extracted = self.db.get_phase1_count()
+        self._last_stored_page = self._last_meta_flush_page = start_page - 1
         
-        # PRODUCTION: Unlimited loop until end of data
-        while True:
-            self.logger.info(f"--- Page {page_num} ---")
-            
-            page_tenders = self.extract_tenders_from_page(page)
-            
-            if page_tenders:
-                # UPSERT to database (insert new, update existing)
-                inserted, updated = self.db.upsert_tenders_batch(page_tenders)
-                total_extracted = self.db.get_phase1_count()
+        # Pages are stored on one background writer thread while the browser
+        # moves on; at most one page is in flight, so pages still commit in order
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.portal_id}_db")
+        pending = None
+        
+        try:
+            # PRODUCTION: Unlimited loop until end of data
+            while True:
+                self.logger.info(f"--- Page {page_num} ---")
                 
-                self.logger.info(f"Extracted {len(page_tenders)} tenders")
-                self.logger.info(f"  Inserted: {inserted}, Updated: {updated}")
-                self.logger.info(f"  Total in database: {total_extracted}")
+                # Rows and the Next link come back from the same evaluate
+                page_tenders, next_url = self.scrape_listing_page(page, page_num)
                 
-                self.db.set_metadata('last_page_extracted', str(page_num))
+                if pending is not None:
+                    total_extracted = pending.result()
+                    pending = None
                 
-                # Save Excel every 10 pages
-                if page_num % 10 == 0:
-                    excel_file = self.config.get_excel_path(f"Phase1_Page{page_num}.xlsx")
-                    self.db.export_to_excel(excel_file)
-            else:
-                self.logger.warning(f"No tenders on page {page_num}")
-            
-            self.pages_scraped = page_num
-            
-            # Check for next page
-            next_url = self.get_next_page_link_with_retry(page, page_num)
-            
-            if not next_url:
-                self.logger.info(f"\n{'='*80}")
-                self.logger.info(f"END OF DATA REACHED AT PAGE {page_num}")
-                self.logger.info(f"{'='*80}\n")
-                break
-            
-            # Navigate to next page with retry
-            success = False
-            for attempt in range(1, 3 + 1):
-                try:
-                    self.logger.info(f"Navigating to page {page_num + 1}...")
-                    page.goto(next_url, wait_until="domcontentloaded", timeout=self.page_load_timeout)
-                    time.sleep(self.pagination_delay)
-                    success = True
+                if page_tenders:
+                    pending = writer.submit(self._store_page, page_num, page_tenders)
+                else:
+                    self.logger.warning(f"No tenders on page {page_num}")
+                
+                self.pages_scraped = page_num
+                
+                if not next_url:
+                    self.logger.info(f"\n{'='*80}")
+                    self.logger.info(f"END OF DATA REACHED AT PAGE {page_num}")
+                    self.logger.info(f"{'='*80}\n")
                     break
+                
+                # Politeness delay between listing requests; the render wait after
+                # goto only covers page readiness, not request pacing
+                time.sleep(self.pagination_delay)
+
+                # Navigate to next page with retry
+                success = False
+                for attempt in range(1, 3 + 1):
+                    try:
+                        self.logger.info(f"Navigating to page {page_num + 1}...")
+                        page.goto(next_url, wait_until="domcontentloaded", timeout=self.page_load_timeout)
+                        success = True
+                        break
+                    except Exception as e:
+                        self.logger.warning(f"Navigation attempt {attempt} failed: {e}")
+                        if attempt < 3:
+                            page.reload()
+                            time.sleep(self._backoff_delay(attempt))
+                
+                if not success:
+                    self.logger.error(f"Could not navigate to page {page_num + 1}")
+                    break
+                
+                # Proceed as soon as the listing has rendered. A page with neither rows
+                # nor a Next link is left to the end-of-data check.
+                try:
+                    page.wait_for_selector(self._LISTING_READY_SELECTOR, timeout=self.page_load_timeout)
                 except Exception as e:
-                    self.logger.warning(f"Navigation attempt {attempt} failed: {e}")
-                    if attempt < 3:
-                        page.reload()
-                        time.sleep(1)
-            
-            if not success:
-                self.logger.error(f"Could not navigate to page {page_num + 1}")
-                break
+                    self.logger.warning(f"Listing on page {page_num + 1} did not render: {e}")
+                
+                page_num += 1
             
-            page_num += 1
+            if pending is not None:
+                total_extracted = pending.result()
+        finally:
+            writer.shutdown(wait=True)
+            # Persist the resume point for the pages since the last gated write
+            if self._last_stored_page > self._last_meta_flush_page:
+                self.db.set_metadata('last_page_extracted', str(self._last_stored_page))
+                self._last_meta_flush_page = self._last_stored_page
+        
+        total_extracted = self.db.get_phase1_count()
         
         self.logger.info(f"\n{'='*80}")
         self.logger.info(f"PHASE 1 COMPLETE")
@@ -895,6 +1290,41 @@ class IsolatedPortalScraper:
         self.db.set_metadata('phase1_complete', 'true')
         return total_extracted
     
+    def _store_page(self, page_num: int, page_tenders: List[dict]) -> int:
+        """
+        UPSERT one page of tenders and record it as the resume point.
+        Runs on the Phase 1 writer thread; returns the portal's Phase 1 total.
+        """
+        # UPSERT to database (insert new, update existing)
+        inserted, updated = self.db.upsert_tenders_batch(page_tenders)
+        self._phase1_total += inserted
+        total_extracted = self._phase1_total
+        
+        self.logger.info(f"Extracted {len(page_tenders)} tenders")
+        self.logger.info(f"  Inserted: {inserted}, Updated: {updated}")
+        self.logger.info(f"  Total in database: {total_extracted}")
+        
+        # Resume may replay up to metadata_flush_every pages; the upsert makes that harmless
+        self._last_stored_page = page_num
+        if page_num - self._last_meta_flush_page >= self.metadata_flush_every:
+            self.db.set_metadata('last_page_extracted', str(page_num))
+            self._last_meta_flush_page = page_num
+        
+        # Save Excel every 10 pages, at most once per export interval
+        if page_num % 10 == 0:
+            self._export_progress(f"Phase1_Page{page_num}.xlsx")
+        
+        return total_extracted
+    
+    def _export_progress(self, filename: str, filter_kept_only: bool = False):
+        """Write a mid-run Excel mirror unless one was written within export_interval_seconds"""
+        now = time.monotonic()
+        if self._last_export and now - self._last_export < self.export_interval_seconds:
+            return
+        
+        self._last_export = now
+        self.db.export_to_excel(self.config.get_excel_path(filename), filter_kept_only=filter_kept_only)
+    
     def run_ai_filtering(self):
         """AI filtering phase"""
         if not self.ai_checker:
@@ -905,26 +1335,28 @@ class IsolatedPortalScraper:
         self.logger.info("AI FILTERING")
         self.logger.info("="*80)
         
-        tenders_to_filter = self.db.get_tenders_for_ai_filtering()
+        stats = self.db.get_statistics()
+        to_filter = stats['total_extracted'] - stats['ai_kept'] - stats['ai_filtered']
         
-        if not tenders_to_filter:
+        if not to_filter:
             self.logger.info("No tenders need filtering")
             return
         
-        self.logger.info(f"Filtering {len(tenders_to_filter)} tenders...")
+        self.logger.info(f"Filtering {to_filter} tenders...")
         
-        batch_size = 50
-        for i in range(0, len(tenders_to_filter), batch_size):
-            batch = tenders_to_filter[i:i+batch_size]
+        # Enough titles per call for check_titles to keep all its API workers busy
+        batch_size = self.ai_checker.BATCH_SIZE * self.ai_checker.MAX_WORKERS
+        total_batches = (to_filter - 1) // batch_size + 1
+        for batch_num, batch in enumerate(self.db.iter_tenders_for_ai_filtering(batch_size), 1):
             titles = [t['title'] for t in batch]
             
-            self.logger.info(f"Batch {i//batch_size + 1}/{(len(tenders_to_filter)-1)//batch_size + 1}...")
+            self.logger.info(f"Batch {batch_num}/{total_batches}...")
             results = self.ai_checker.check_titles(titles)
             
-            for tender in batch:
-                is_meaningful = results.get(tender['title'], False)
-                keep = not is_meaningful
-                self.db.mark_ai_filtered(tender['hash'], keep)
+            # Keep = NOT meaningful, written for the whole batch at once
+            self.db.mark_ai_filtered_batch([
+                (tender['hash'], not results.get(tender['title'], False)) for tender in batch
+            ])
         
         stats = self.db.get_statistics()
         self.logger.info(f"\nFiltering complete: {stats['ai_kept']} kept, {stats['ai_filtered']} filtered\n")
@@ -934,32 +1366,26 @@ class IsolatedPortalScraper:
         
         self.db.set_metadata('ai_filtering_complete', 'true')
     
-    def fetch_work_description(self, url: str, context: BrowserContext, retry: int = 0) -> str:
-        """Fetch work description with proper extraction"""
-        page = None
+    async def fetch_work_description(self, url: str, page: AsyncPage) -> str:
+        """Fetch work description with proper extraction, on a reused Phase 2 page"""
         try:
-            page = context.new_page()
-            page.set_default_timeout(self.page_load_timeout)
-            
-            try:
-                page.goto(url, wait_until="domcontentloaded", timeout=self.page_load_timeout)
-            except Exception as e:
-                if retry < 2:
-                    page.close()
-                    time.sleep(1)
-                    return self.fetch_work_description(url, context, retry + 1)
-                raise e
+            for attempt in range(3):
+                try:
+                    await page.goto(url, wait_until="domcontentloaded", timeout=self.page_load_timeout)
+                    break
+                except Exception:
+                    if attempt == 2:
+                        raise
+                    await asyncio.sleep(self._backoff_delay(attempt + 1))
             
             if "CommonErrorPage" in page.url:
                 return "ERROR: Session expired"
             
-            time.sleep(self.phase2_delay)
-            
-            # Method 1: CSS selector
+            # Method 1: CSS selector (the wait returns as soon as the captions render)
             try:
-                page.wait_for_selector("td.td_caption", timeout=5000)
+                await page.wait_for_selector("td.td_caption", timeout=5000)
                 work_desc_selector = "td.td_caption:has-text('Work Description') + td.td_field"
-                raw_text = page.inner_text(work_desc_selector)
+                raw_text = await page.inner_text(work_desc_selector)
                 cleaned_text = " ".join(raw_text.split())
                 
                 if cleaned_text:
@@ -967,28 +1393,26 @@ class IsolatedPortalScraper:
             except Exception:
                 pass
             
-            # Method 2: Fallback
+            # Method 2: Fallback, scanning the table rows in one evaluate
             try:
-                rows = page.query_selector_all("tbody tr")
-                for row in rows:
-                    cells = row.query_selector_all("td")
-                    if len(cells) >= 2 and "Work Description" in cells[0].inner_text():
-                        work_desc = cells[1].inner_text().strip()
-                        cleaned = " ".join(work_desc.split())
-                        if cleaned:
-                            return cleaned
+                work_desc = await page.evaluate(self._WORK_DESC_FALLBACK_JS)
+                cleaned = " ".join(work_desc.split()) if work_desc else ""
+                if cleaned:
+                    return cleaned
             except Exception:
                 pass
             
             return "WORK_DESCRIPTION_NOT_FOUND"
         except Exception as e:
             return f"FETCH_ERROR: {str(e)[:100]}"
-        finally:
-            if page:
-                page.close()
     
-    def run_phase2(self, context: BrowserContext):
-        """Phase 2: Fetch work descriptions sequentially"""
+    def run_phase2(self):
+        """
+        Phase 2: Fetch work descriptions.
+        Detail pages are fetched concurrently by an async Playwright pool on a
+        separate thread; the listing browser's cookies are handed over so the
+        portal session carries into Phase 2.
+        """
         self.logger.info("="*80)
         self.logger.info("PHASE 2: WORK DESCRIPTIONS")
         self.logger.info("="*80)
@@ -999,53 +1423,20 @@ class IsolatedPortalScraper:
             self.logger.info("No tenders need Phase 2")
             return
         
-        self.logger.info(f"Processing {len(tenders)} tenders...")
+        self.logger.info(f"Processing {len(tenders)} tenders ({self.phase2_concurrency} pages in parallel)...")
         
-        processed = 0
-        success = 0
-        failed = 0
+        # The sync listing browser is done once its session state is captured
+        storage_state = self._context.storage_state() if self._context is not None else None
+        self.close_browser()
         
-        for idx, tender in enumerate(tenders, 1):
-            # Refresh session every N tenders
-            if idx % self.session_refresh_every == 1 and idx > 1:
-                self.logger.info(f"\n🔄 Refreshing session...")
-                try:
-                    refresh_page = context.new_page()
-                    refresh_page.goto(self.config.portal_url, wait_until="domcontentloaded", timeout=self.page_load_timeout)
-                    time.sleep(1)
-                    refresh_page.close()
-                    self.logger.info("✓ Session refreshed\n")
-                except Exception as e:
-                    self.logger.warning(f"Session refresh warning: {e}")
-            
-            try:
-                work_desc = self.fetch_work_description(tender['url'], context)
-                
-                if work_desc.startswith("ERROR") or work_desc.startswith("FETCH") or work_desc.startswith("WORK_DESCRIPTION"):
-                    self.db.update_work_description(tender['hash'], work_desc, 'failed')
-                    self.db.add_failed_url(tender['id'], tender['url'], work_desc)
-                    failed += 1
-                else:
-                    self.db.update_work_description(tender['hash'], work_desc, 'success')
-                    success += 1
-                
-                processed += 1
-                
-                if processed % 10 == 0:
-                    self.logger.info(f"Progress: {processed}/{len(tenders)} ({success} success, {failed} failed)")
-                
-                if processed % 50 == 0:
-                    excel_file = self.config.get_excel_path(f"Phase2_Progress_{processed}.xlsx")
-                    self.db.export_to_excel(excel_file, filter_kept_only=True)
-            
-            except Exception as e:
-                self.logger.error(f"Error processing tender {idx}: {e}")
-                self.db.update_work_description(tender['hash'], f"PROCESSING_ERROR: {str(e)[:100]}", 'failed')
-                failed += 1
-                processed += 1
+        progress = {'total': len(tenders), 'processed': 0, 'success': 0, 'failed': 0,
+                    'updates': [], 'failed_urls': [], 'session_errors': 0}
+        # asyncio.run gets its own thread, away from the sync Playwright loop
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.portal_id}_phase2") as executor:
+            executor.submit(asyncio.run, self._run_phase2_async(tenders, storage_state, progress)).result()
         
         self.logger.info(f"\n{'='*80}")
-        self.logger.info(f"PHASE 2 COMPLETE: {success} success, {failed} failed")
+        self.logger.info(f"PHASE 2 COMPLETE: {progress['success']} success, {progress['failed']} failed")
         self.logger.info(f"{'='*80}\n")
         
         excel_file = self.config.get_excel_path("Phase2_Complete.xlsx")
@@ -1053,8 +1444,138 @@ class IsolatedPortalScraper:
         
         self.db.set_metadata('phase2_complete', 'true')
     
-    def run(self) -> dict:
-        """Main execution method - PRODUCTION VERSION"""
+    async def _run_phase2_async(self, tenders: List[dict], storage_state: Optional[dict], progress: dict):
+        """Drain the Phase 2 queue with a fixed pool of pages on one browser context"""
+        queue = asyncio.Queue()
+        for tender in tenders:
+            queue.put_nowait(tender)
+        
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=False)
+            try:
+                context = await browser.new_context(ignore_https_errors=True, storage_state=storage_state)
+                await context.route("**/*", self._route_request_async)
+                workers = min(self.phase2_concurrency, len(tenders))
+                await asyncio.gather(*(self._phase2_worker(context, queue, progress) for _ in range(workers)))
+                await context.close()
+            finally:
+                # Flush first: closing a crashed browser can raise, and must not
+                # cost the buffered results
+                try:
+                    self._flush_phase2(progress)
+                finally:
+                    await browser.close()
+    
+    def _take_phase2_batch(self, progress: dict):
+        """Swap the buffered Phase 2 results out for fresh lists and return them"""
+        updates, failed_urls = progress['updates'], progress['failed_urls']
+        progress['updates'], progress['failed_urls'] = [], []
+        return updates, failed_urls
+    
+    def _write_phase2_batch(self, updates: list, failed_urls: list):
+        """Write Phase 2 results (and failed URLs) in batch transactions"""
+        if updates:
+            self.db.update_work_descriptions_batch(updates)
+        if failed_urls:
+            self.db.add_failed_urls_batch(failed_urls)
+    
+    def _flush_phase2(self, progress: dict):
+        """Write buffered Phase 2 results (and failed URLs) in batch transactions"""
+        self._write_phase2_batch(*self._take_phase2_batch(progress))
+    
+    async def _route_request_async(self, route):
+        """Async counterpart of _route_request for the Phase 2 context"""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _phase2_worker(self, context: AsyncBrowserContext, queue: asyncio.Queue, progress: dict):
+        """Fetch queued tenders on one page, reused for every URL this worker takes"""
+        page = await context.new_page()
+        page.set_default_timeout(self.page_load_timeout)
+        fetched = 0
+        
+        try:
+            while True:
+                try:
+                    tender = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                # Refresh session every N tenders
+                if fetched and fetched % self.session_refresh_every == 0:
+                    await self._refresh_session(page)
+                fetched += 1
+                
+                try:
+                    work_desc = await self.fetch_work_description(tender['url'], page)
+                    
+                    # Circuit breaker: a run of expired sessions/timeouts across the pool
+                    # refreshes right away and retries this tender once. The counter is
+                    # shared and reset before the await, so one worker refreshes the
+                    # context's session for all of them.
+                    if self._is_session_error(work_desc):
+                        progress['session_errors'] += 1
+                        if progress['session_errors'] >= self.session_breaker_threshold:
+                            self.logger.warning(f"{progress['session_errors']} consecutive session errors - refreshing session early")
+                            progress['session_errors'] = 0
+                            await self._refresh_session(page)
+                            work_desc = await self.fetch_work_description(tender['url'], page)
+                    else:
+                        progress['session_errors'] = 0
+                    
+                    if _FAILURE_RE.match(work_desc):
+                        progress['updates'].append((tender['hash'], work_desc, 'failed'))
+                        progress['failed_urls'].append((tender['id'], tender['url'], work_desc))
+                        progress['failed'] += 1
+                    else:
+                        progress['updates'].append((tender['hash'], work_desc, 'success'))
+                        progress['success'] += 1
+                
+                except Exception as e:
+                    self.logger.error(f"Error processing tender {tender['s_no']}: {e}")
+                    progress['updates'].append((tender['hash'], f"PROCESSING_ERROR: {str(e)[:100]}", 'failed'))
+                    progress['failed'] += 1
+                
+                progress['processed'] += 1
+                processed = progress['processed']
+                
+                if processed % 10 == 0:
+                    self.logger.info(f"Progress: {processed}/{progress['total']} ({progress['success']} success, {progress['failed']} failed)")
+                
+                # The batch is swapped out before the write, so the other workers keep
+                # fetching into a fresh buffer while the DB write and mirror run in
+                # a thread instead of on the event loop
+                if len(progress['updates']) >= self.phase2_flush_every:
+                    updates, failed_urls = self._take_phase2_batch(progress)
+                    await asyncio.to_thread(self._write_phase2_batch, updates, failed_urls)
+                    await asyncio.to_thread(
+                        self._export_progress, f"Phase2_Progress_{processed}.xlsx", filter_kept_only=True
+                    )
+        finally:
+            await page.close()
+    
+    async def _refresh_session(self, page: AsyncPage):
+        """Revisit the portal home page to keep the session alive"""
+        try:
+            await page.goto(self.config.portal_url, wait_until="domcontentloaded", timeout=self.page_load_timeout)
+            await asyncio.sleep(1)
+        except Exception as e:
+            self.logger.warning(f"Session refresh warning: {e}")
+    
+    @staticmethod
+    def _is_session_error(work_desc: str) -> bool:
+        """True for results that point at a dead session rather than a bad tender"""
+        return work_desc == "ERROR: Session expired" or (
+            work_desc.startswith("FETCH_ERROR") and 'timeout' in work_desc.lower()
+        )
+    
+    def run(self, ready_event=None) -> dict:
+        """
+        Main execution method - PRODUCTION VERSION
+        ready_event (optional) is set as soon as the browser has launched.
+        """
         start_time = datetime.now()
         stats = {'status': 'unknown', 'error': None}
         
@@ -1064,42 +1585,40 @@ class IsolatedPortalScraper:
         self.logger.info("="*80)
         
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
-                context = browser.new_context()
-                page = context.new_page()
-                page.set_default_timeout(self.page_load_timeout)
+            page = self.get_page()
+            
+            if ready_event is not None:
+                ready_event.set()
+            
+            try:
+                # Phase 1: Unlimited pagination
+                if not self.db.get_metadata('phase1_complete'):
+                    if not self.navigate_to_closing_within_7_days(page):
+                        raise Exception("Navigation failed")
+                    self.run_phase1(page)
+                else:
+                    self.logger.info("✓ Phase 1 already complete\n")
+                    # Get pages count from metadata
+                    last_page = self.db.get_metadata('last_page_extracted')
+                    if last_page:
+                        self.pages_scraped = int(last_page)
                 
-                try:
-                    # Phase 1: Unlimited pagination
-                    if not self.db.get_metadata('phase1_complete'):
-                        if not self.navigate_to_closing_within_7_days(page):
-                            raise Exception("Navigation failed")
-                        self.run_phase1(page)
-                    else:
-                        self.logger.info("✓ Phase 1 already complete\n")
-                        # Get pages count from metadata
-                        last_page = self.db.get_metadata('last_page_extracted')
-                        if last_page:
-                            self.pages_scraped = int(last_page)
-                    
-                    # AI Filtering
-                    if self.ai_checker and not self.db.get_metadata('ai_filtering_complete'):
-                        self.run_ai_filtering()
-                    else:
-                        self.logger.info("✓ AI filtering skipped\n")
-                    
-                    # Phase 2
-                    if not self.db.get_metadata('phase2_complete'):
-                        self.run_phase2(context)
-                    else:
-                        self.logger.info("✓ Phase 2 already complete\n")
-                    
-                    stats['status'] = 'success'
-                    
-                finally:
-                    context.close()
-                    browser.close()
+                # AI Filtering
+                if self.ai_checker and not self.db.get_metadata('ai_filtering_complete'):
+                    self.run_ai_filtering()
+                else:
+                    self.logger.info("✓ AI filtering skipped\n")
+                
+                # Phase 2 (the listing session's cookies carry over)
+                if not self.db.get_metadata('phase2_complete'):
+                    self.run_phase2()
+                else:
+                    self.logger.info("✓ Phase 2 already complete\n")
+                
+                stats['status'] = 'success'
+                
+            finally:
+                self.close_browser()
         
         except Exception as e:
             self.logger.error(f"Fatal error: {e}")